@@ -5,7 +5,7 @@ Revises: 16b647d2bca8
 Create Date: 2025-11-27 09:17:14.891696
 
 """
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -16,15 +16,97 @@ branch_labels = None
 depends_on = None
 
 
+BATCH_SIZE = 10000
+
+
+def _backfill_in_batches(table: str, columns: list[str]) -> None:
+    """Copy each enum column into its <column>_new varchar shadow in small batches."""
+    pending = " OR ".join(f"({col}_new IS NULL AND {col} IS NOT NULL)" for col in columns)
+    assignments = ", ".join(f"{col}_new = {col}::text" for col in columns)
+
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {table} SET {assignments} WHERE {pending}")
+        return
+
+    # Each batch commits on its own so no single statement holds row locks
+    # on the whole table
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(sa.text(
+                f"UPDATE {table} SET {assignments} "
+                f"WHERE ctid IN (SELECT ctid FROM {table} WHERE {pending} LIMIT :batch_size)"
+            ), {"batch_size": BATCH_SIZE})
+            if result.rowcount < BATCH_SIZE:
+                break
+
+
+def _create_sync_trigger(table: str, columns: list[str]) -> None:
+    """Mirror every write to the enum columns into their shadows until the swap."""
+    assignments = "\n".join(f"            NEW.{col}_new := NEW.{col}::text;" for col in columns)
+    op.execute(f"""
+        CREATE FUNCTION {table}_sync_varchar_new() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+{assignments}
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute(
+        f"CREATE TRIGGER {table}_sync_varchar_new BEFORE INSERT OR UPDATE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION {table}_sync_varchar_new()"
+    )
+
+
+def _drop_sync_trigger(table: str) -> None:
+    op.execute(f"DROP TRIGGER {table}_sync_varchar_new ON {table}")
+    op.execute(f"DROP FUNCTION {table}_sync_varchar_new()")
+
+
 def upgrade() -> None:
-    # Convert trips.vehicle_type from enum to varchar
-    op.execute("ALTER TABLE trips ALTER COLUMN vehicle_type TYPE VARCHAR(20) USING vehicle_type::text")
-    
-    # Convert trips.status from enum to varchar
-    op.execute("ALTER TABLE trips ALTER COLUMN status TYPE VARCHAR(20) USING status::text")
-    
-    # Convert trip_members.status from enum to varchar
-    op.execute("ALTER TABLE trip_members ALTER COLUMN status TYPE VARCHAR(20) USING status::text")
+    # Instead of ALTER COLUMN ... TYPE (which rewrites every row and every index
+    # under an ACCESS EXCLUSIVE lock), add varchar shadow columns, backfill them
+    # in batches, then swap them in with catalog-only DROP/RENAME. A trigger
+    # mirrors writes made during the backfill (new rows, or updates to rows
+    # already copied), which would otherwise be lost with the old columns.
+
+    # trips.vehicle_type and trips.status
+    op.execute(
+        "ALTER TABLE trips "
+        "ADD COLUMN vehicle_type_new VARCHAR(20), "
+        "ADD COLUMN status_new VARCHAR(20)"
+    )
+    _create_sync_trigger("trips", ["vehicle_type", "status"])
+    # NOT VALID: enforced for new writes now, checked against old rows below
+    op.execute(
+        "ALTER TABLE trips ADD CONSTRAINT trips_vehicle_type_new_not_null "
+        "CHECK (vehicle_type_new IS NOT NULL) NOT VALID"
+    )
+    _backfill_in_batches("trips", ["vehicle_type", "status"])
+    with op.get_context().autocommit_block():
+        # Scans the table under SHARE UPDATE EXCLUSIVE, so writers keep going
+        op.execute("ALTER TABLE trips VALIDATE CONSTRAINT trips_vehicle_type_new_not_null")
+    _drop_sync_trigger("trips")
+    op.execute(
+        "ALTER TABLE trips "
+        "DROP COLUMN vehicle_type, "
+        "DROP COLUMN status"
+    )
+    op.execute("ALTER TABLE trips RENAME COLUMN vehicle_type_new TO vehicle_type")
+    op.execute("ALTER TABLE trips RENAME COLUMN status_new TO status")
+    # The validated CHECK lets SET NOT NULL skip its full-table scan
+    op.execute("ALTER TABLE trips ALTER COLUMN vehicle_type SET NOT NULL")
+    op.execute("ALTER TABLE trips DROP CONSTRAINT trips_vehicle_type_new_not_null")
+    op.create_index('ix_trips_status', 'trips', ['status'], unique=False)
+
+    # trip_members.status
+    op.execute("ALTER TABLE trip_members ADD COLUMN status_new VARCHAR(20)")
+    _create_sync_trigger("trip_members", ["status"])
+    _backfill_in_batches("trip_members", ["status"])
+    _drop_sync_trigger("trip_members")
+    op.execute("ALTER TABLE trip_members DROP COLUMN status")
+    op.execute("ALTER TABLE trip_members RENAME COLUMN status_new TO status")
 
 
 def downgrade() -> None:
@@ -16,22 +16,28 @@ down_revision = '06c0461f2853'
 branch_labels = None
 depends_on = None
 
+# (name, table, referent table, local columns, ondelete) for the redesigned tables
+FOREIGN_KEYS = [
+    ('ride_requests_user_id_fkey', 'ride_requests', 'users', ['user_id'], 'CASCADE'),
+    ('grouped_rides_admin_id_fkey', 'grouped_rides', 'admins', ['admin_id'], 'CASCADE'),
+    ('grouped_rides_driver_id_fkey', 'grouped_rides', 'drivers', ['driver_id'], 'SET NULL'),
+    ('ride_requests_grouped_ride_id_fkey', 'ride_requests', 'grouped_rides', ['grouped_ride_id'], 'SET NULL'),
+    ('ride_notifications_user_id_fkey', 'ride_notifications', 'users', ['user_id'], 'CASCADE'),
+    ('ride_notifications_grouped_ride_id_fkey', 'ride_notifications', 'grouped_rides', ['grouped_ride_id'], 'CASCADE'),
+    ('ratings_user_id_fkey', 'ratings', 'users', ['user_id'], 'CASCADE'),
+    ('ratings_driver_id_fkey', 'ratings', 'drivers', ['driver_id'], 'CASCADE'),
+    ('ratings_grouped_ride_id_fkey', 'ratings', 'grouped_rides', ['grouped_ride_id'], 'CASCADE'),
+]
+
 
 def upgrade() -> None:
-    # Drop foreign key constraints first
-    op.drop_constraint('chat_messages_trip_id_fkey', 'chat_messages', type_='foreignkey')
-    op.drop_constraint('payments_trip_id_fkey', 'payments', type_='foreignkey')
-    op.drop_constraint('ratings_trip_id_fkey', 'ratings', type_='foreignkey')
-    
-    # Drop old tables in correct order
-    op.drop_table('trip_members')
-    op.drop_table('trips')
-    op.drop_table('riders')
-    
-    # Drop chat_messages and payments as they're trip-specific
-    op.drop_table('chat_messages')
-    op.drop_table('payment_splits')  # Drop payment_splits before payments
-    op.drop_table('payments')
+    # Drop the old trip tables (chat_messages and payments are trip-specific)
+    # in one statement. CASCADE also removes foreign keys pointing at them from
+    # other tables, such as ratings.trip_id.
+    op.execute(
+        "DROP TABLE IF EXISTS trip_members, trips, riders, chat_messages, "
+        "payment_splits, payments CASCADE"
+    )
     
     # Update users table - remove role, add new fields
     op.execute("ALTER TABLE users DROP COLUMN IF EXISTS role")
@@ -39,12 +45,9 @@ def upgrade() -> None:
     op.add_column('users', sa.Column('total_rides', sa.Integer(), server_default='0', nullable=False))
     op.add_column('users', sa.Column('total_savings', sa.Float(), server_default='0.0', nullable=False))
     
-    # Rename total_trips to match (if it exists)
-    try:
-        op.alter_column('users', 'total_trips', new_column_name='total_rides_old')
-        op.drop_column('users', 'total_rides_old')
-    except:
-        pass  # Column might not exist
+    # Drop the legacy total_trips column (if it exists). IF EXISTS avoids a
+    # failed ALTER aborting the surrounding transaction.
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS total_trips")
     
     # Drop and recreate drivers table as standalone (not linked to users)
     op.drop_table('drivers')
@@ -100,11 +103,8 @@ def upgrade() -> None:
         sa.Column('grouped_ride_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_ride_requests_status', 'ride_requests', ['status'])
-    op.create_index('ix_ride_requests_user_id', 'ride_requests', ['user_id'])
     
     # Create admins table if it doesn't exist (it seems it was missing in previous migrations)
     op.create_table(
@@ -119,7 +119,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('email')
     )
-    op.create_index('ix_admins_email', 'admins', ['email'], unique=True)
 
     # Create grouped_rides table
     op.create_table(
@@ -135,14 +134,8 @@ def upgrade() -> None:
         sa.Column('status', sa.String(20), server_default='pending_acceptance', nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['admin_id'], ['admins.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['driver_id'], ['drivers.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_grouped_rides_status', 'grouped_rides', ['status'])
-    
-    # Add foreign key from ride_requests to grouped_rides
-    op.create_foreign_key('ride_requests_grouped_ride_id_fkey', 'ride_requests', 'grouped_rides', ['grouped_ride_id'], ['id'], ondelete='SET NULL')
     
     # Create ride_notifications table
     op.create_table(
@@ -156,12 +149,8 @@ def upgrade() -> None:
         sa.Column('responded_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['grouped_ride_id'], ['grouped_rides.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_ride_notifications_status', 'ride_notifications', ['status'])
-    op.create_index('ix_ride_notifications_user_id', 'ride_notifications', ['user_id'])
     
     # Drop and recreate ratings table
     op.drop_table('ratings')
@@ -176,9 +165,6 @@ def upgrade() -> None:
         sa.Column('testimonial_text', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['driver_id'], ['drivers.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['grouped_ride_id'], ['grouped_rides.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
     
@@ -199,6 +185,25 @@ def upgrade() -> None:
         ).bindparams(pwd=hashed_pwd)
     )
 
+    # Foreign keys are added last and NOT VALID, so loading the new tables
+    # never pays per-row FK trigger checks. They are validated below, outside
+    # the load transaction, under a lock that does not block writers.
+    for name, table, referent, local_cols, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referent, local_cols, ['id'], ondelete=ondelete, postgresql_not_valid=True)
+
+    # Build indexes concurrently so writers are not blocked while they build.
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_ride_requests_status', 'ride_requests', ['status'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ride_requests_user_id', 'ride_requests', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_admins_email', 'admins', ['email'], unique=True, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_grouped_rides_status', 'grouped_rides', ['status'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ride_notifications_status', 'ride_notifications', ['status'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ride_notifications_user_id', 'ride_notifications', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+
+        for name, table, _referent, _local_cols, _ondelete in FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
 
 def downgrade() -> None:
     # This is a major redesign - downgrade not fully supported
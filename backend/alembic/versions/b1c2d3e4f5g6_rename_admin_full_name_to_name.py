@@ -5,7 +5,7 @@ Revises: aee12e345291
 Create Date: 2025-11-28 19:15:00.000000
 
 """
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -17,8 +17,23 @@ depends_on = None
 
 
 def upgrade() -> None:
-    pass
+    # Some databases were renamed by hand before this revision existed
+    if not context.is_offline_mode():
+        has_full_name = op.get_bind().execute(sa.text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'admins' AND column_name = 'full_name'"
+        )).scalar()
+        if not has_full_name:
+            return
+
+    # The rename is catalog-only but needs ACCESS EXCLUSIVE; fail fast instead
+    # of queueing every query on admins behind a blocked lock request
+    op.execute("SET lock_timeout = '2s'")
+    op.alter_column('admins', 'full_name', new_column_name='name')
+    op.execute("RESET lock_timeout")
 
 
 def downgrade() -> None:
+    op.execute("SET lock_timeout = '2s'")
     op.alter_column('admins', 'name', new_column_name='full_name')
+    op.execute("RESET lock_timeout")
@@ -21,4 +21,6 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
+    op.execute("SET lock_timeout = '2s'")
     op.drop_column('admins', 'is_active')
+    op.execute("RESET lock_timeout")
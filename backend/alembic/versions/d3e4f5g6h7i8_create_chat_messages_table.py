@@ -33,7 +33,9 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['admin_id'], ['admins.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_chat_messages_grouped_ride_id', 'chat_messages', ['grouped_ride_id'])
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_chat_messages_grouped_ride_id', 'chat_messages', ['grouped_ride_id'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
@@ -29,10 +29,12 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
     )
     
-    # Create indexes for better query performance
-    op.create_index('idx_system_notifications_user_id', 'system_notifications', ['user_id'])
-    op.create_index('idx_system_notifications_is_read', 'system_notifications', ['is_read'])
-    op.create_index('idx_system_notifications_created_at', 'system_notifications', ['created_at'], postgresql_ops={'created_at': 'DESC'})
+    # Create indexes for better query performance.
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_system_notifications_user_id', 'system_notifications', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_system_notifications_is_read', 'system_notifications', ['is_read'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_system_notifications_created_at', 'system_notifications', ['created_at'], postgresql_ops={'created_at': 'DESC'}, postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
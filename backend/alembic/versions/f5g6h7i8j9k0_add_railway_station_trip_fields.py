@@ -16,13 +16,20 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add new columns to grouped_rides table
-    op.add_column('grouped_rides', sa.Column('total_seats', sa.Integer(), nullable=False, server_default='4'))
-    op.add_column('grouped_rides', sa.Column('is_railway_station_trip', sa.Boolean(), nullable=False, server_default='false'))
-    op.add_column('grouped_rides', sa.Column('auto_created', sa.Boolean(), nullable=False, server_default='false'))
+    # Add new columns to grouped_rides table in a single ALTER TABLE (one lock,
+    # one catalog update). Constant defaults are stored as fast defaults on
+    # PostgreSQL 11+, so no table rewrite happens.
+    op.execute(
+        "ALTER TABLE grouped_rides "
+        "ADD COLUMN total_seats INTEGER NOT NULL DEFAULT 4, "
+        "ADD COLUMN is_railway_station_trip BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN auto_created BOOLEAN NOT NULL DEFAULT false"
+    )
     
-    # Create index for railway station trips for faster lookups
-    op.create_index('idx_grouped_rides_railway_station', 'grouped_rides', ['is_railway_station_trip', 'pickup_time'])
+    # Create index for railway station trips for faster lookups.
+    # Built concurrently so writes to grouped_rides are not blocked.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_grouped_rides_railway_station', 'grouped_rides', ['is_railway_station_trip', 'pickup_time'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
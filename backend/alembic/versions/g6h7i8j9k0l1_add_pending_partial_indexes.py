@@ -0,0 +1,45 @@
+"""add partial indexes for pending queues
+
+Revision ID: g6h7i8j9k0l1
+Revises: f5g6h7i8j9k0
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'g6h7i8j9k0l1'
+down_revision = 'f5g6h7i8j9k0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial indexes only cover rows still waiting in a queue, so they stay
+    # small and return pending rows already ordered by creation time.
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ride_requests_pending_created', 'ride_requests', ['created_at'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_ride_notifications_pending_created', 'ride_notifications', ['created_at'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_grouped_rides_pending_acceptance_created', 'grouped_rides', ['created_at'],
+            postgresql_where=sa.text("status = 'pending_acceptance'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_grouped_rides_pending_acceptance_created', table_name='grouped_rides', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_ride_notifications_pending_created', table_name='ride_notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_ride_requests_pending_created', table_name='ride_requests', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""use brin indexes for append-only timestamps
+
+Revision ID: h7i8j9k0l1m2
+Revises: g6h7i8j9k0l1
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'h7i8j9k0l1m2'
+down_revision = 'g6h7i8j9k0l1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # system_notifications and chat_messages are append-only, so created_at
+    # follows the physical row order and a BRIN index (min/max per block range)
+    # serves time range scans at a tiny fraction of a B-tree's size.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_system_notifications_created_at_brin', 'system_notifications', ['created_at'],
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'idx_system_notifications_created_at', table_name='system_notifications',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.create_index(
+            'ix_chat_messages_created_at_brin', 'chat_messages', ['created_at'],
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_chat_messages_created_at_brin', table_name='chat_messages', postgresql_concurrently=True, if_exists=True)
+        op.create_index(
+            'idx_system_notifications_created_at', 'system_notifications', ['created_at'],
+            postgresql_ops={'created_at': 'DESC'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index('idx_system_notifications_created_at_brin', table_name='system_notifications', postgresql_concurrently=True, if_exists=True)
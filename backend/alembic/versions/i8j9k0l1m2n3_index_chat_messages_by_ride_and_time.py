@@ -0,0 +1,35 @@
+"""index chat messages by ride and time
+
+Revision ID: i8j9k0l1m2n3
+Revises: h7i8j9k0l1m2
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'i8j9k0l1m2n3'
+down_revision = 'h7i8j9k0l1m2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Chat history is always read as "one ride, ordered by time"; a composite
+    # index turns that into an index range scan with no sort step.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_messages_grouped_ride_id_created_at', 'chat_messages',
+            ['grouped_ride_id', 'created_at'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chat_messages_grouped_ride_id_created_at', table_name='chat_messages',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,35 @@
+"""drop redundant chat_messages grouped_ride_id index
+
+Revision ID: j9k0l1m2n3o4
+Revises: i8j9k0l1m2n3
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'j9k0l1m2n3o4'
+down_revision = 'i8j9k0l1m2n3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (grouped_ride_id, created_at) serves every lookup the single-column
+    # index did (B-trees scan either direction, so DESC reads need no sort);
+    # keeping both only costs write amplification on each chat insert.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chat_messages_grouped_ride_id', table_name='chat_messages',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_messages_grouped_ride_id', 'chat_messages', ['grouped_ride_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
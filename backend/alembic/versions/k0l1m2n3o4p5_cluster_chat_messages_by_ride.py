@@ -0,0 +1,33 @@
+"""cluster chat_messages by ride and time
+
+Revision ID: k0l1m2n3o4p5
+Revises: j9k0l1m2n3o4
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'k0l1m2n3o4p5'
+down_revision = 'j9k0l1m2n3o4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Messages from concurrent rides interleave on the heap in insert order,
+    # so one ride's history is spread over many pages. Rewriting the table in
+    # (grouped_ride_id, created_at) order packs each conversation together.
+    # CLUSTER also marks the index, so a periodic bare `CLUSTER chat_messages;`
+    # (or pg_repack) restores the ordering as new messages drift it.
+    # Note: CLUSTER holds an ACCESS EXCLUSIVE lock while it rewrites the table.
+    op.execute(
+        'CLUSTER chat_messages USING ix_chat_messages_grouped_ride_id_created_at'
+    )
+    op.execute('ANALYZE chat_messages')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE chat_messages SET WITHOUT CLUSTER')
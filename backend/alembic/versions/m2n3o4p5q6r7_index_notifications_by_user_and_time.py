@@ -0,0 +1,73 @@
+"""index notifications by user and time
+
+Revision ID: m2n3o4p5q6r7
+Revises: k0l1m2n3o4p5
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'm2n3o4p5q6r7'
+down_revision = 'k0l1m2n3o4p5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Both notification lists are "WHERE user_id = ? ORDER BY <time> DESC", so
+    # a (user_id, time DESC) index returns them presorted instead of fetching
+    # every row for the user and sorting.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ride_notifications_user_sent', 'ride_notifications', ['user_id', 'sent_at'],
+            postgresql_ops={'sent_at': 'DESC'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_ride_notifications_user_id', table_name='ride_notifications',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.create_index(
+            'idx_system_notifications_user_created', 'system_notifications', ['user_id', 'created_at'],
+            postgresql_ops={'created_at': 'DESC'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'idx_system_notifications_user_id', table_name='system_notifications',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        # Nothing filters on is_read; indexing it only stopped the "mark as
+        # read" update from being a HOT (heap-only) update.
+        op.drop_index(
+            'idx_system_notifications_is_read', table_name='system_notifications',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+    # Leave room on each page for those in-place is_read updates, and vacuum
+    # sooner so the visibility map stays current for index-only scans.
+    op.execute(
+        'ALTER TABLE system_notifications SET '
+        '(fillfactor = 90, autovacuum_vacuum_scale_factor = 0.05)'
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE system_notifications RESET '
+        '(fillfactor, autovacuum_vacuum_scale_factor)'
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_system_notifications_is_read', 'system_notifications', ['is_read'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'idx_system_notifications_user_id', 'system_notifications', ['user_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index('idx_system_notifications_user_created', table_name='system_notifications', postgresql_concurrently=True, if_exists=True)
+        op.create_index('ix_ride_notifications_user_id', 'ride_notifications', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_ride_notifications_user_sent', table_name='ride_notifications', postgresql_concurrently=True, if_exists=True)
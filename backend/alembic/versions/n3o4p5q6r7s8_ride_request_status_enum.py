@@ -0,0 +1,110 @@
+"""store ride_requests.status as a native enum
+
+Revision ID: n3o4p5q6r7s8
+Revises: m2n3o4p5q6r7
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'n3o4p5q6r7s8'
+down_revision = 'm2n3o4p5q6r7'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 10000
+
+STATUSES = ('pending', 'grouped', 'assigned', 'accepted', 'rejected', 'completed', 'cancelled')
+
+
+def _backfill_in_batches(cast: str) -> None:
+    """Copy ride_requests.status into status_new, casting to ``cast``, in small batches."""
+    pending = "status_new IS NULL AND status IS NOT NULL"
+    assignment = f"status_new = status::text::{cast}"
+
+    if context.is_offline_mode():
+        op.execute(f"UPDATE ride_requests SET {assignment} WHERE {pending}")
+        return
+
+    # Each batch commits on its own so no single statement holds row locks
+    # on the whole table
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(sa.text(
+                f"UPDATE ride_requests SET {assignment} "
+                f"WHERE ctid IN (SELECT ctid FROM ride_requests WHERE {pending} LIMIT :batch_size)"
+            ), {"batch_size": BATCH_SIZE})
+            if result.rowcount < BATCH_SIZE:
+                break
+
+
+def _swap_status_column(column_type: str, cast: str) -> None:
+    # Same approach as 06c0461f2853: a shadow column backfilled in batches and
+    # swapped in with catalog-only DROP/RENAME, instead of ALTER COLUMN ... TYPE
+    # rewriting the table under an ACCESS EXCLUSIVE lock.
+    op.execute(f"ALTER TABLE ride_requests ADD COLUMN status_new {column_type}")
+    # Writes made while the backfill runs (new rows, or a status change on a
+    # row already copied) are mirrored into status_new by a trigger, so the
+    # old column can be dropped without a final catch-up pass.
+    op.execute(f"""
+        CREATE FUNCTION ride_requests_sync_status_new() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.status_new := NEW.status::text::{cast};
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute(
+        "CREATE TRIGGER ride_requests_sync_status_new BEFORE INSERT OR UPDATE ON ride_requests "
+        "FOR EACH ROW EXECUTE FUNCTION ride_requests_sync_status_new()"
+    )
+    # NOT VALID: enforced for new writes now, checked against old rows below
+    op.execute(
+        "ALTER TABLE ride_requests ADD CONSTRAINT ride_requests_status_new_not_null "
+        "CHECK (status_new IS NOT NULL) NOT VALID"
+    )
+    _backfill_in_batches(cast)
+    with op.get_context().autocommit_block():
+        # Scans the table under SHARE UPDATE EXCLUSIVE, so writers keep going
+        op.execute("ALTER TABLE ride_requests VALIDATE CONSTRAINT ride_requests_status_new_not_null")
+
+    op.execute("DROP TRIGGER ride_requests_sync_status_new ON ride_requests")
+    op.execute("DROP FUNCTION ride_requests_sync_status_new()")
+    # Dropping the old column also drops the indexes on it
+    op.execute("ALTER TABLE ride_requests DROP COLUMN status")
+    op.execute("ALTER TABLE ride_requests RENAME COLUMN status_new TO status")
+    op.execute(f"ALTER TABLE ride_requests ALTER COLUMN status SET DEFAULT 'pending'::{cast}")
+    # The validated CHECK lets SET NOT NULL skip its full-table scan
+    op.execute("ALTER TABLE ride_requests ALTER COLUMN status SET NOT NULL")
+    op.execute("ALTER TABLE ride_requests DROP CONSTRAINT ride_requests_status_new_not_null")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ride_requests_status', 'ride_requests', ['status'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_ride_requests_pending_created', 'ride_requests', ['created_at'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def upgrade() -> None:
+    # An enum value is a fixed 4 bytes and compares as an integer, against a
+    # varlena string for VARCHAR; ride_requests is the largest status-filtered
+    # table, so both the heap and its two status indexes shrink.
+    values = ", ".join(f"'{status}'" for status in STATUSES)
+    op.execute(f"CREATE TYPE ride_request_status AS ENUM ({values})")
+    _swap_status_column("ride_request_status", "ride_request_status")
+
+
+def downgrade() -> None:
+    _swap_status_column("VARCHAR(20)", "varchar")
+    op.execute("DROP TYPE ride_request_status")
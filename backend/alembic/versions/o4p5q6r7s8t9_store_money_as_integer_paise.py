@@ -0,0 +1,135 @@
+"""store money columns as integer paise
+
+Revision ID: o4p5q6r7s8t9
+Revises: n3o4p5q6r7s8
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'o4p5q6r7s8t9'
+down_revision = 'n3o4p5q6r7s8'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 10000
+
+# table -> money columns converted from float8 rupees to int4 paise
+MONEY_COLUMNS = {
+    'grouped_rides': ['actual_price', 'charged_price'],
+    'users': ['total_savings'],
+}
+# Columns that end up NOT NULL; the backfill and sync trigger fill NULLs with
+# the column default so no catch-up UPDATE is needed after the swap
+NOT_NULL_COLUMNS = {
+    'users': ['total_savings'],
+}
+
+
+def _converted(table: str, col: str, ref: str, expression: str, default: str) -> str:
+    """SQL computing the new value of ``col`` from ``ref`` (the old column or NEW.<col>)."""
+    value = expression.format(col=ref)
+    if col in NOT_NULL_COLUMNS.get(table, ()):
+        value = f"COALESCE({value}, {default})"
+    return value
+
+
+def _backfill_in_batches(table: str, columns: list[str], expression: str, default: str) -> None:
+    """Fill each <column>_new shadow from ``expression`` (``{col}`` is the old column) in small batches."""
+    pending = " OR ".join(
+        f"{col}_new IS NULL" if col in NOT_NULL_COLUMNS.get(table, ())
+        else f"({col}_new IS NULL AND {col} IS NOT NULL)"
+        for col in columns
+    )
+    assignments = ", ".join(
+        f"{col}_new = " + _converted(table, col, col, expression, default) for col in columns
+    )
+
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {table} SET {assignments} WHERE {pending}")
+        return
+
+    # Each batch commits on its own so no single statement holds row locks
+    # on the whole table
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(sa.text(
+                f"UPDATE {table} SET {assignments} "
+                f"WHERE ctid IN (SELECT ctid FROM {table} WHERE {pending} LIMIT :batch_size)"
+            ), {"batch_size": BATCH_SIZE})
+            if result.rowcount < BATCH_SIZE:
+                break
+
+
+def _create_sync_trigger(table: str, columns: list[str], expression: str, default: str) -> None:
+    """Mirror every write to the old columns into their shadows until the swap."""
+    assignments = "\n".join(
+        f"            NEW.{col}_new := " + _converted(table, col, f"NEW.{col}", expression, default) + ";"
+        for col in columns
+    )
+    op.execute(f"""
+        CREATE FUNCTION {table}_sync_money_new() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+{assignments}
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute(
+        f"CREATE TRIGGER {table}_sync_money_new BEFORE INSERT OR UPDATE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION {table}_sync_money_new()"
+    )
+
+
+def _swap_columns(column_type: str, expression: str, savings_default: str) -> None:
+    # Shadow columns swapped in with catalog-only DROP/RENAME, as in
+    # n3o4p5q6r7s8, rather than ALTER COLUMN ... TYPE rewriting users (read on
+    # every authenticated request) under an ACCESS EXCLUSIVE lock.
+    for table, columns in MONEY_COLUMNS.items():
+        not_null = NOT_NULL_COLUMNS.get(table, [])
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ADD COLUMN {col}_new {column_type}" for col in columns)
+        )
+        # Without this, a price or savings update landing on a row the
+        # backfill already copied would be lost when the old column is dropped
+        _create_sync_trigger(table, columns, expression, savings_default)
+        # NOT VALID: enforced for new writes now, checked against old rows below
+        for col in not_null:
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_{col}_new_not_null "
+                f"CHECK ({col}_new IS NOT NULL) NOT VALID"
+            )
+        _backfill_in_batches(table, columns, expression, savings_default)
+        if not_null:
+            with op.get_context().autocommit_block():
+                # Scans the table under SHARE UPDATE EXCLUSIVE, so writers keep going
+                for col in not_null:
+                    op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_{col}_new_not_null")
+
+        op.execute(f"DROP TRIGGER {table}_sync_money_new ON {table}")
+        op.execute(f"DROP FUNCTION {table}_sync_money_new()")
+        op.execute(f"ALTER TABLE {table} " + ", ".join(f"DROP COLUMN {col}" for col in columns))
+        for col in columns:
+            op.execute(f"ALTER TABLE {table} RENAME COLUMN {col}_new TO {col}")
+        for col in not_null:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} SET DEFAULT {savings_default}")
+            # The validated CHECK lets SET NOT NULL skip its full-table scan
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} SET NOT NULL")
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_{col}_new_not_null")
+
+
+def upgrade() -> None:
+    # Money is fixed-point: int4 paise is half the width of float8 and sums
+    # exactly. The Paise column type converts back to rupees in Python.
+    _swap_columns("INTEGER", "round({col} * 100)::integer", "0")
+
+
+def downgrade() -> None:
+    _swap_columns("DOUBLE PRECISION", "{col} / 100.0", "0.0")
@@ -0,0 +1,43 @@
+"""add partial indexes for the pending queue and open railway trips
+
+Revision ID: p5q6r7s8t9u0
+Revises: o4p5q6r7s8t9
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'p5q6r7s8t9u0'
+down_revision = 'o4p5q6r7s8t9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The grouping queue lists pending requests by requested_time, and the
+    # railway auto-grouper looks for open railway trips by pickup_time. Both
+    # predicates match a small, moving slice of the table, so partial indexes
+    # stay a few pages and return rows already in range order.
+    # ix_ride_requests_status stays: the admin list filters on any status.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ride_requests_pending_requested_time', 'ride_requests', ['requested_time'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_grouped_rides_open_railway_pickup', 'grouped_rides', ['pickup_time'],
+            postgresql_where=sa.text(
+                "is_railway_station_trip AND status IN ('pending_acceptance', 'confirmed')"
+            ),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_grouped_rides_open_railway_pickup', table_name='grouped_rides', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_ride_requests_pending_requested_time', table_name='ride_requests', postgresql_concurrently=True, if_exists=True)
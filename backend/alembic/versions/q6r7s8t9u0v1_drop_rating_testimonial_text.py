@@ -0,0 +1,27 @@
+"""drop ratings.testimonial_text
+
+Revision ID: q6r7s8t9u0v1
+Revises: p5q6r7s8t9u0
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'q6r7s8t9u0v1'
+down_revision = 'p5q6r7s8t9u0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The testimonial is generated from the rating, ride and user at rating
+    # time and returned in the response; nothing ever read the stored copy.
+    # DROP COLUMN is catalog-only, so this does not rewrite ratings.
+    op.drop_column('ratings', 'testimonial_text')
+
+
+def downgrade() -> None:
+    op.add_column('ratings', sa.Column('testimonial_text', sa.Text(), nullable=True))
@@ -0,0 +1,37 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: r7s8t9u0v1w2
+Revises: q6r7s8t9u0v1
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'r7s8t9u0v1w2'
+down_revision = 'q6r7s8t9u0v1'
+branch_labels = None
+depends_on = None
+
+TABLES = ['users', 'drivers', 'ride_requests', 'grouped_rides']
+
+
+def upgrade() -> None:
+    # Admin lists page by (created_at, id) DESC and resume with a row
+    # comparison against the last row seen. A B-tree on (created_at, id)
+    # scanned backwards serves both the ORDER BY and the seek, so each page
+    # costs the same however deep it is.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f'ix_{table}_created_at_id', table, ['created_at', 'id'],
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(f'ix_{table}_created_at_id', table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,32 @@
+"""index ride_requests.grouped_ride_id
+
+Revision ID: s8t9u0v1w2x3
+Revises: r7s8t9u0v1w2
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 's8t9u0v1w2x3'
+down_revision = 'r7s8t9u0v1w2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The admin ride list counts each ride's requests with a correlated
+    # subquery on grouped_ride_id, and loading a ride's requests filters on
+    # it too. Without an index every count is a scan of ride_requests.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ride_requests_grouped_ride_id', 'ride_requests', ['grouped_ride_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ride_requests_grouped_ride_id', table_name='ride_requests', postgresql_concurrently=True, if_exists=True)
@@ -1,124 +1,443 @@
+import base64
+import binascii
+import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
-
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import threading
+import time
+from datetime import timedelta
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from cachetools import TTLCache
+import jwt
+import orjson
+from jwt import InvalidTokenError
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, load_only, make_transient_to_detached
 
 from .config import settings
 from .database import get_db
 from .email import EmailDeliveryError, send_email
+from .redis import get_redis
 from ..models.user import User
 
-# Password hashing (PBKDF2-SHA256 avoids bcrypt backend issues/length limits)
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Settings are fixed for the life of the process; read the ones used on every
+# authenticated request once instead of going through the settings object.
+_SECRET_KEY = settings.secret_key
+_SECRET_KEY_BYTES = _SECRET_KEY.encode()
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [_ALGORITHM]
+# Every token we issue carries both claims; reject any that don't
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
+# Password hashing (PBKDF2 avoids bcrypt backend issues/length limits).
+# Hashes are computed with hashlib.pbkdf2_hmac (OpenSSL) and stored in
+# passlib's "$pbkdf2-<digest>$<rounds>$<salt>$<checksum>" format. New hashes
+# use SHA-512, whose 64-bit word size suits our servers; SHA-256 hashes from
+# earlier releases still verify and are upgraded on the next login.
+_PBKDF2_SCHEMES = {
+    "$pbkdf2-sha512$": "sha512",
+    "$pbkdf2-sha256$": "sha256",
+}
+_PBKDF2_DEFAULT_PREFIX = "$pbkdf2-sha512$"
+_PBKDF2_SALT_BYTES = 16
+
+
+def _ab64_encode(raw: bytes) -> str:
+    # passlib's "adapted base64": standard alphabet with "." for "+", no padding
+    return base64.b64encode(raw).decode("ascii").rstrip("=").replace("+", ".")
+
+
+def _ab64_decode(value: str) -> bytes:
+    value = value.replace(".", "+")
+    return base64.b64decode(value + "=" * (-len(value) % 4))
+
+
+def _split_pbkdf2(hashed_password: str) -> Optional[Tuple[str, str, str, str]]:
+    """Return (prefix, rounds, salt, checksum) for a supported hash."""
+    if not hashed_password:
+        return None
+    for prefix in _PBKDF2_SCHEMES:
+        if hashed_password.startswith(prefix):
+            parts = hashed_password[len(prefix):].split("$")
+            if len(parts) != 3:
+                return None
+            return (prefix, *parts)
+    return None
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using PBKDF2-SHA256"""
-    return pwd_context.hash(password)
+    """Hash a password using PBKDF2-SHA512"""
+    rounds = settings.password_hash_rounds
+    salt = secrets.token_bytes(_PBKDF2_SALT_BYTES)
+    digest = _PBKDF2_SCHEMES[_PBKDF2_DEFAULT_PREFIX]
+    checksum = hashlib.pbkdf2_hmac(digest, password.encode(), salt, rounds)
+    return f"{_PBKDF2_DEFAULT_PREFIX}{rounds}${_ab64_encode(salt)}${_ab64_encode(checksum)}"
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a hash uses a legacy scheme or stale round count."""
+    parts = _split_pbkdf2(hashed_password)
+    if parts is None:
+        return True
+    prefix, rounds, _salt, _checksum = parts
+    return prefix != _PBKDF2_DEFAULT_PREFIX or rounds != str(settings.password_hash_rounds)
+
+
+def _check_pbkdf2(plain_password: str, hashed_password: str) -> bool:
+    parts = _split_pbkdf2(hashed_password)
+    if parts is None:
+        return False
+    prefix, rounds, salt, checksum = parts
+    try:
+        expected = _ab64_decode(checksum)
+        computed = hashlib.pbkdf2_hmac(
+            _PBKDF2_SCHEMES[prefix], plain_password.encode(), _ab64_decode(salt), int(rounds)
+        )
+    except (ValueError, binascii.Error):
+        return False
+    return hmac.compare_digest(computed, expected)
+
+
+# Recently verified (password, hash) pairs. Only successful verifications are
+# cached, keyed by a digest so plaintext passwords are never kept in memory.
+_verified_passwords: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_verified_passwords_lock = threading.Lock()
+
+
+def _password_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    return hashlib.blake2b(
+        plain_password.encode() + b"|" + hashed_password.encode(),
+        digest_size=16,
+        key=_SECRET_KEY_BYTES[:64],
+    ).digest()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a PBKDF2-SHA256 hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a PBKDF2-SHA512 or legacy PBKDF2-SHA256 hash"""
+    key = _password_cache_key(plain_password, hashed_password)
+    with _verified_passwords_lock:
+        if key in _verified_passwords:
+            return True
+
+    if not _check_pbkdf2(plain_password, hashed_password):
+        return False
+
+    with _verified_passwords_lock:
+        _verified_passwords[key] = True
+    return True
 
 # Email verification
 
+# Static parts of the verification email; only the code changes per send
+_VERIFY_SUBJECT = "Verify your email for GoTogether"
+_VERIFY_TEXT_TEMPLATE = (
+    "Thanks for signing up for GoTogether!\n\n"
+    "Use the verification code below within 30 minutes to confirm your email address:\n\n"
+    "    {code}\n\n"
+    "If you did not request this, you can safely ignore this email."
+)
+_VERIFY_HTML_TEMPLATE = (
+    "<p>Thanks for signing up for GoTogether!</p>"
+    "<p>Use the verification code below within 30 minutes to confirm your email address:</p>"
+    "<p style=\"font-size:18px;font-weight:bold;letter-spacing:2px;\">{code}</p>"
+    "<p>If you did not request this, you can safely ignore this email.</p>"
+)
+
+
+# Checks allowed per OTP or verification token. Once they are used up the
+# code is revoked and the user has to request a new one.
+MAX_VERIFY_ATTEMPTS = 5
+
+
+async def _record_verify_attempt(redis_client, key: str, ttl: int) -> bool:
+    """Count one check against key; False once the allowance is used up."""
+    attempts_key = f"{key}:attempts"
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.incr(attempts_key)
+        pipe.expire(attempts_key, ttl)
+        attempts, _ = await pipe.execute()
+    if attempts > MAX_VERIFY_ATTEMPTS:
+        await redis_client.delete(key)
+        return False
+    return True
+
 
 class EmailVerificationService:
-    """Email verification token management and delivery."""
+    """Email verification token management and delivery.
+
+    Pending tokens live in Redis so they survive restarts and are shared
+    between workers; Redis expires them after 30 minutes.
+    """
 
-    def __init__(self):
-        self._pending_tokens: dict[str, dict[str, datetime]] = {}
+    TOKEN_TTL_SECONDS = 30 * 60
 
     async def send_token(self, email: str) -> str:
         token = secrets.token_urlsafe(16)
-        expires_at = datetime.utcnow() + timedelta(minutes=30)
-
-        subject = "Verify your email for GoTogether"
-        verification_code = token
-        text_body = (
-            "Thanks for signing up for GoTogether!\n\n"
-            f"Use the verification code below within 30 minutes to confirm your email address:\n\n"
-            f"    {verification_code}\n\n"
-            "If you did not request this, you can safely ignore this email."
-        )
-        html_body = (
-            "<p>Thanks for signing up for GoTogether!</p>"
-            "<p>Use the verification code below within 30 minutes to confirm your email address:</p>"
-            f"<p style=\"font-size:18px;font-weight:bold;letter-spacing:2px;\">{verification_code}</p>"
-            "<p>If you did not request this, you can safely ignore this email.</p>"
-        )
+
+        text_body = _VERIFY_TEXT_TEMPLATE.replace("{code}", token)
+        html_body = _VERIFY_HTML_TEMPLATE.replace("{code}", token)
 
         try:
-            await send_email(email, subject, text_body, html_body)
+            await send_email(email, _VERIFY_SUBJECT, text_body, html_body)
         except EmailDeliveryError as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to send verification email",
             ) from exc
 
-        self._pending_tokens[token] = {
-            "email": email.lower(),
-            "expires_at": expires_at,
-        }
+        redis_client = await get_redis()
+        await redis_client.set(
+            f"emailverify:{token}", email.lower(), ex=self.TOKEN_TTL_SECONDS
+        )
         return token
 
     async def verify_token(self, email: str, token: str) -> bool:
-        data = self._pending_tokens.get(token)
-        if not data:
-            return False
+        # The token is only consumed once it matches, so a mistyped email
+        # does not burn it
+        key = f"emailverify:{token}"
+        redis_client = await get_redis()
+        stored_email = await redis_client.get(key)
 
-        if data["email"] != email.lower():
+        if not stored_email:
             return False
-
-        if datetime.utcnow() > data["expires_at"]:
-            del self._pending_tokens[token]
+        if not await _record_verify_attempt(redis_client, key, self.TOKEN_TTL_SECONDS):
+            return False
+        if not hmac.compare_digest(stored_email.encode(), email.lower().encode()):
             return False
 
-        del self._pending_tokens[token]
-        return True
+        # Of concurrent matching requests, only the one whose DELETE removes
+        # the key succeeds
+        return await redis_client.delete(key) == 1
 
 
 # JWT token security
 security = HTTPBearer()
 
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+# The JWT header never changes, so it is serialized and encoded once
+_JWT_HEADER_B64 = _b64url(
+    orjson.dumps({"alg": _ALGORITHM, "typ": "JWT"})
+)
+
+
+def _encode_jwt(payload: dict) -> str:
+    """Sign an HMAC JWT, reusing the pre-encoded header."""
+    digest = _HMAC_DIGESTS.get(_ALGORITHM)
+    if digest is None:
+        return jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM)
+
+    payload_b64 = _b64url(orjson.dumps(payload))
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, digest).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
 
 def _create_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode = data.copy()
+    # JWT "exp" is an integer epoch; computing it directly avoids building
+    # datetime/timedelta objects on every token issued.
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        ttl_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        ttl_seconds = settings.access_token_expire_minutes * 60
 
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    return _encode_jwt({**data, "exp": int(time.time()) + ttl_seconds})
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token for authenticated users with role metadata."""
-    to_encode = data.copy()
-    return _create_token(to_encode, expires_delta)
+    return _create_token(data, expires_delta)
+
+
+def _parse_uuid(value: str) -> Optional[UUID]:
+    try:
+        return UUID(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Decoded payloads of recently seen tokens, so repeat requests with the same
+# bearer token skip the HMAC check. Entries are re-checked against "exp" on
+# every hit. Rejected tokens are remembered briefly to absorb retry storms.
+_decoded_tokens: TTLCache = TTLCache(maxsize=8192, ttl=60)
+_rejected_tokens: TTLCache = TTLCache(maxsize=8192, ttl=5)
+_token_cache_lock = threading.Lock()
+
+
+def _decode_token(token: str) -> Optional[dict]:
+    """Decode and verify a JWT, returning its payload or None if invalid."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        payload = _decoded_tokens.get(key)
+        rejected = key in _rejected_tokens
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return payload
+        with _token_cache_lock:
+            _decoded_tokens.pop(key, None)
+        return None
+    if rejected:
+        return None
+
+    try:
+        payload = jwt.decode(
+            token, _SECRET_KEY, algorithms=_ALGORITHMS, options=_JWT_DECODE_OPTIONS
+        )
+    except InvalidTokenError:
+        with _token_cache_lock:
+            _rejected_tokens[key] = True
+        return None
+
+    with _token_cache_lock:
+        _decoded_tokens[key] = payload
+    return payload
 
 
 def verify_token(token: str) -> Optional[Tuple[str, Optional[str]]]:
     """Verify JWT token and return (user_id, role)."""
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        user_id: Optional[str] = payload.get("sub")
-        if user_id is None:
-            return None
-        role = payload.get("role")
-        return user_id, role
-    except JWTError:
+    payload = _decode_token(token)
+    if payload is None:
+        return None
+    user_id: Optional[str] = payload.get("sub")
+    if user_id is None:
+        return None
+    role = payload.get("role")
+    return user_id, role
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def verify_tokens_bulk(tokens: List[str]) -> List[Optional[str]]:
+    """Verify many JWTs at once and return each one's user_id (or None).
+
+    Cache lookups and inserts happen under a single lock acquisition, each
+    distinct token is checked once, and payloads are only JSON-decoded after
+    their HMAC signature matches. Tokens we did not sign ourselves (different
+    header) go through the regular PyJWT path.
+    """
+    digest = _HMAC_DIGESTS.get(_ALGORITHM)
+    unique = list(dict.fromkeys(tokens))
+    keys = [hashlib.blake2b(token.encode(), digest_size=16).digest() for token in unique]
+    now = time.time()
+
+    payloads: dict = {}
+    misses = []
+    with _token_cache_lock:
+        for token, key in zip(unique, keys):
+            cached = _decoded_tokens.get(key)
+            if cached is not None:
+                payloads[token] = cached if cached["exp"] > now else None
+            elif key in _rejected_tokens:
+                payloads[token] = None
+            else:
+                misses.append((token, key))
+
+    header = _JWT_HEADER_B64.decode("ascii") + "."
+    verified = []
+    rejected = []
+    for token, key in misses:
+        signing_input, _, signature = token.rpartition(".")
+        if digest is None or not signing_input.startswith(header):
+            payloads[token] = _decode_token(token)
+            continue
+
+        expected = _b64url(hmac.new(_SECRET_KEY_BYTES, signing_input.encode(), digest).digest())
+        payload = None
+        if hmac.compare_digest(expected, signature.encode()):
+            try:
+                payload = orjson.loads(_b64url_decode(signing_input[len(header):]))
+            except (ValueError, binascii.Error):
+                payload = None
+        if (
+            not isinstance(payload, dict)
+            or not isinstance(payload.get("exp"), (int, float))
+            or payload["exp"] <= now
+            or payload.get("sub") is None
+        ):
+            payloads[token] = None
+            rejected.append(key)
+        else:
+            payloads[token] = payload
+            verified.append((key, payload))
+
+    with _token_cache_lock:
+        for key, payload in verified:
+            _decoded_tokens[key] = payload
+        for key in rejected:
+            _rejected_tokens[key] = True
+
+    results = []
+    for token in tokens:
+        payload = payloads[token]
+        results.append(payload.get("sub") if payload else None)
+    return results
+
+
+# Detached snapshots of recently authenticated users, keyed by id. A dashboard
+# load fires several authenticated calls at once; they share one SELECT and
+# each gets its own session-bound copy via merge(load=False). The short TTL
+# bounds how stale is_active and profile fields can get.
+_user_cache: TTLCache = TTLCache(maxsize=2048, ttl=5)
+_user_cache_lock = threading.Lock()
+
+
+def _snapshot_user(user: User) -> User:
+    # Copy only loaded columns: touching a deferred one (hashed_password)
+    # would emit a SELECT just to cache a value no request reads
+    loaded = inspect(user).dict
+    columns = {
+        attr.key: loaded[attr.key]
+        for attr in inspect(User).column_attrs
+        if attr.key in loaded
+    }
+    snapshot = User(**columns)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def load_user(db: Session, user_id: str) -> Optional[User]:
+    """Load a user by id, going through the short-lived user cache."""
+    user_uuid = _parse_uuid(user_id)
+    if user_uuid is None:
         return None
 
+    with _user_cache_lock:
+        snapshot = _user_cache.get(user_uuid)
+    if snapshot is not None:
+        return db.merge(snapshot, load=False)
+
+    # Primary-key lookup; served from the session identity map when possible
+    user = db.get(User, user_uuid)
+    if user is not None:
+        snapshot = _snapshot_user(user)
+        with _user_cache_lock:
+            _user_cache[user_uuid] = snapshot
+    return user
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop a user's cached snapshot after their row changes."""
+    user_uuid = user_id if isinstance(user_id, UUID) else _parse_uuid(str(user_id))
+    with _user_cache_lock:
+        _user_cache.pop(user_uuid, None)
+
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -134,7 +453,7 @@ async def get_current_user(
         raise credentials_exception
 
     user_id, _role = verified
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
     if user is None:
         raise credentials_exception
 
@@ -147,7 +466,7 @@ async def get_current_user(
     return user
 
 
-async def get_current_user_with_role(
+def get_current_user_with_role(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> Tuple[User, Optional[str]]:
@@ -161,7 +480,7 @@ async def get_current_user_with_role(
         )
 
     user_id, role_claim = verified
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -197,18 +516,17 @@ def create_admin_token(admin_id: str, expires_delta: Optional[timedelta] = None)
 
 def verify_admin_token(token: str) -> Optional[str]:
     """Verify admin JWT token and return admin_id."""
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        admin_id: Optional[str] = payload.get("sub")
-        token_type: Optional[str] = payload.get("type")
-        if admin_id is None or token_type != "admin":
-            return None
-        return admin_id
-    except JWTError:
+    payload = _decode_token(token)
+    if payload is None:
+        return None
+    admin_id: Optional[str] = payload.get("sub")
+    token_type: Optional[str] = payload.get("type")
+    if admin_id is None or token_type != "admin":
         return None
+    return admin_id
 
 
-async def get_current_admin(
+def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ):
@@ -228,7 +546,19 @@ async def get_current_admin(
     if admin_id is None:
         raise credentials_exception
 
-    admin = db.query(Admin).filter(Admin.id == admin_id).first()
+    admin_uuid = _parse_uuid(admin_id)
+    # Admin routes only read identity and role; leave the password hash and
+    # timestamps unloaded (they load on access if a route needs them)
+    admin = db.get(
+        Admin,
+        admin_uuid,
+        options=[
+            load_only(
+                Admin.id, Admin.email, Admin.name, Admin.role,
+                Admin.is_active, Admin.is_super_admin,
+            )
+        ],
+    ) if admin_uuid else None
     if admin is None:
         raise credentials_exception
 
@@ -244,28 +574,27 @@ async def get_current_admin(
 # Mock OTP service for development
 class MockOTPService:
     """Mock OTP service for development and testing"""
-    
-    def __init__(self):
-        self._pending_otps = {}  # In production, use Redis
+
+    OTP_TTL_SECONDS = 5 * 60
     
     async def send_otp(self, phone: str) -> str:
         """Send OTP to phone number (mocked)"""
-        request_id = f"req_{datetime.utcnow().timestamp()}"
+        request_id = f"req_{secrets.token_urlsafe(12)}"
         
         # In development, always use the same OTP
         if settings.otp_mock_enabled:
             otp = settings.otp_mock_code
         else:
             # In production, generate random OTP and send via SMS
-            import random
-            otp = str(random.randint(100000, 999999))
+            otp = f"{secrets.randbelow(900000) + 100000:06d}"
         
         # Store OTP with expiration (5 minutes)
-        self._pending_otps[request_id] = {
-            "phone": phone,
-            "otp": otp,
-            "expires_at": datetime.utcnow() + timedelta(minutes=5)
-        }
+        redis_client = await get_redis()
+        await redis_client.set(
+            f"otp:{request_id}",
+            orjson.dumps({"phone": phone, "otp": otp}),
+            ex=self.OTP_TTL_SECONDS,
+        )
         
         # In production, send SMS here
         print(f"[MOCK] OTP for {phone}: {otp}")
@@ -274,23 +603,28 @@ class MockOTPService:
     
     async def verify_otp(self, request_id: str, phone: str, otp: str) -> bool:
         """Verify OTP code"""
-        if request_id not in self._pending_otps:
+        # Expired OTPs have already been evicted by Redis. A wrong code costs
+        # one of MAX_VERIFY_ATTEMPTS; the OTP is consumed only on a match.
+        key = f"otp:{request_id}"
+        redis_client = await get_redis()
+        raw = await redis_client.get(key)
+
+        if raw is None:
             return False
-        
-        stored = self._pending_otps[request_id]
-        
-        # Check if expired
-        if datetime.utcnow() > stored["expires_at"]:
-            del self._pending_otps[request_id]
+        if not await _record_verify_attempt(redis_client, key, self.OTP_TTL_SECONDS):
             return False
+
+        stored = orjson.loads(raw)
         
-        # Check if phone and OTP match
-        if stored["phone"] != phone or stored["otp"] != otp:
+        # Check if phone and OTP match, in constant time
+        if not hmac.compare_digest(
+            f"{stored['phone']}|{stored['otp']}".encode(), f"{phone}|{otp}".encode()
+        ):
             return False
-        
-        # Clean up used OTP
-        del self._pending_otps[request_id]
-        return True
+
+        # Of concurrent correct submissions, only the one whose DELETE
+        # removes the key succeeds
+        return await redis_client.delete(key) == 1
 
 
 # Global service instances
@@ -1,7 +1,8 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -24,6 +25,9 @@ class Settings(BaseSettings):
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 7 days
+
+    # Password hashing (PBKDF2-SHA512 iteration count)
+    password_hash_rounds: int = 25000
     
     # OTP (Mock for development)
     otp_mock_enabled: bool = True
@@ -60,10 +64,18 @@ class Settings(BaseSettings):
     smtp_from_email: Optional[str] = None
     smtp_from_name: Optional[str] = None
 
-    class Config:
-        env_file = str(BASE_DIR.parent / ".env")
-        env_file_encoding = "utf-8"
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=str(BASE_DIR.parent / ".env"),
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings once per process (reads the environment and .env)."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -14,6 +14,9 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+# Sessions are synchronous. Endpoints and dependencies that use one without
+# awaiting anything are plain ``def`` so FastAPI runs them in its threadpool;
+# an ``async def`` doing blocking queries would stall the event loop.
 def get_db():
     """Dependency to get database session"""
     db = SessionLocal()
@@ -1,8 +1,10 @@
 import asyncio
-import smtplib
 from email.message import EmailMessage
+from functools import lru_cache
 from typing import Optional
 
+import aiosmtplib
+
 from .config import settings
 
 
@@ -10,6 +12,16 @@ class EmailDeliveryError(Exception):
     """Raised when an email cannot be delivered."""
 
 
+@lru_cache(maxsize=1)
+def _from_header() -> str:
+    # Settings are frozen, so the sender header only needs formatting once
+    from_name = settings.smtp_from_name or settings.app_name
+    from_email = settings.smtp_from_email
+    if not from_email:
+        raise EmailDeliveryError("SMTP from email is not configured")
+    return f"{from_name} <{from_email}>"
+
+
 def _build_message(
     to_email: str,
     subject: str,
@@ -17,13 +29,8 @@ def _build_message(
     html_body: Optional[str] = None,
 ) -> EmailMessage:
     msg = EmailMessage()
-    from_name = settings.smtp_from_name or settings.app_name
-    from_email = settings.smtp_from_email
-    if not from_email:
-        raise EmailDeliveryError("SMTP from email is not configured")
-
     msg["Subject"] = subject
-    msg["From"] = f"{from_name} <{from_email}>"
+    msg["From"] = _from_header()
     msg["To"] = to_email
     msg.set_content(text_body)
 
@@ -33,33 +40,50 @@ def _build_message(
     return msg
 
 
-def _send_email_sync(message: EmailMessage) -> None:
+# One SMTP session kept open on the event loop and shared by all sends, so
+# emails neither pay for a new STARTTLS handshake and AUTH each time nor tie
+# up a worker thread. SMTP can't interleave messages on one connection, so
+# sends are serialized with a lock.
+_smtp_client: Optional[aiosmtplib.SMTP] = None
+_smtp_lock: Optional[asyncio.Lock] = None
+
+
+async def _connect() -> aiosmtplib.SMTP:
     if not settings.smtp_host:
         raise EmailDeliveryError("SMTP host is not configured")
+    if settings.smtp_username and not settings.smtp_password:
+        raise EmailDeliveryError("SMTP password is not configured")
 
-    host = settings.smtp_host
     port = settings.smtp_port or (587 if settings.smtp_use_tls else 25)
-
-    if settings.smtp_use_tls:
-        server = smtplib.SMTP(host, port, timeout=30)
-    else:
-        server = smtplib.SMTP(host, port, timeout=30)
-
-    try:
-        if settings.smtp_use_tls:
-            server.starttls()
-
-        if settings.smtp_username:
-            if not settings.smtp_password:
-                raise EmailDeliveryError("SMTP password is not configured")
-            server.login(settings.smtp_username, settings.smtp_password)
-
-        server.send_message(message)
-    finally:
+    client = aiosmtplib.SMTP(
+        hostname=settings.smtp_host,
+        port=port,
+        use_tls=False,
+        start_tls=settings.smtp_use_tls,
+        username=settings.smtp_username or None,
+        password=settings.smtp_password if settings.smtp_username else None,
+        timeout=30,
+    )
+    await client.connect()
+    return client
+
+
+async def _get_client() -> aiosmtplib.SMTP:
+    global _smtp_client
+    if _smtp_client is None or not _smtp_client.is_connected:
+        _smtp_client = await _connect()
+    return _smtp_client
+
+
+async def close_email():
+    """Close the shared SMTP connection"""
+    global _smtp_client
+    if _smtp_client is not None and _smtp_client.is_connected:
         try:
-            server.quit()
-        except Exception:
-            server.close()
+            await _smtp_client.quit()
+        except aiosmtplib.SMTPException:
+            _smtp_client.close()
+    _smtp_client = None
 
 
 async def send_email(
@@ -69,5 +93,23 @@ async def send_email(
     html_body: Optional[str] = None,
 ) -> None:
     """Send an email asynchronously using SMTP settings."""
+    global _smtp_client, _smtp_lock
     message = _build_message(to_email, subject, text_body, html_body)
-    await asyncio.to_thread(_send_email_sync, message)
+
+    if _smtp_lock is None:
+        _smtp_lock = asyncio.Lock()
+
+    async with _smtp_lock:
+        client = await _get_client()
+        try:
+            await client.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # The server dropped the idle session; reconnect once and retry
+            _smtp_client = None
+            client = await _get_client()
+            await client.send_message(message)
+        except Exception:
+            # Don't reuse a session in an unknown state
+            client.close()
+            _smtp_client = None
+            raise
@@ -1,24 +1,46 @@
+from typing import Optional
+
 import redis.asyncio as redis
 from .config import settings
 
-# Redis connection pool
-redis_pool = None
+# Shared Redis client, created once at application startup
+redis_client: Optional[redis.Redis] = None
+# Same server, but replies stay bytes: for payloads that are forwarded as-is
+# (chat pub/sub) and would otherwise be decoded and re-encoded on every hop
+redis_binary_client: Optional[redis.Redis] = None
+
+
+async def init_redis():
+    """Create the shared Redis clients and their connection pools"""
+    global redis_client, redis_binary_client
+    redis_client = redis.Redis.from_url(
+        settings.redis_url,
+        encoding="utf-8",
+        decode_responses=True,
+        max_connections=50,
+    )
+    redis_binary_client = redis.Redis.from_url(
+        settings.redis_url,
+        max_connections=20,
+    )
 
 
-async def get_redis():
+async def get_redis() -> redis.Redis:
     """Get Redis connection"""
-    global redis_pool
-    if redis_pool is None:
-        redis_pool = redis.ConnectionPool.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True
-        )
-    return redis.Redis(connection_pool=redis_pool)
+    return redis_client
+
+
+async def get_redis_binary() -> redis.Redis:
+    """Get the Redis connection that returns raw bytes"""
+    return redis_binary_client
 
 
 async def close_redis():
-    """Close Redis connection pool"""
-    global redis_pool
-    if redis_pool:
-        await redis_pool.disconnect()
+    """Close Redis connection pools"""
+    global redis_client, redis_binary_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+    if redis_binary_client is not None:
+        await redis_binary_client.aclose()
+        redis_binary_client = None
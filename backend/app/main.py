@@ -1,6 +1,6 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 import json
 import uuid
@@ -9,7 +9,9 @@ from typing import Dict, List
 
 from .core.config import settings
 from .core.database import get_db
-from .core.redis import get_redis, close_redis
+from .core.redis import get_redis, init_redis, close_redis
+from .core.email import close_email
+from .routes.chat import manager as chat_manager, start_chat_writer, stop_chat_writer
 from .routes import (
     auth_router,
     ride_requests_router,
@@ -31,7 +33,8 @@ app = FastAPI(
     version=settings.version,
     debug=settings.debug,
     docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None
+    redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -41,6 +44,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browser clients read the keyset pagination cursor
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -208,19 +213,33 @@ async def health_check():
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
+    await init_redis()
+    start_chat_writer()
     print(f"Starting {settings.app_name} v{settings.version}")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    await stop_chat_writer()
+    await chat_manager.close()
     await close_redis()
+    await close_email()
     print("Shutting down GoTogether API")
 
 if __name__ == "__main__":
     import uvicorn
+    # uvloop/httptools come with uvicorn[standard]; outside debug pin them
+    # explicitly rather than relying on auto-detection
+    server_impl = {} if settings.debug else {
+        "loop": "uvloop", "http": "httptools", "ws": "websockets",
+    }
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.debug
+        reload=settings.debug,
+        **server_impl,
+        # Chat frames are small and fanned out to every rider; compressing
+        # the same payload once per socket isn't worth the CPU
+        ws_per_message_deflate=False,
     )
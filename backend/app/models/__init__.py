@@ -7,6 +7,8 @@ from .payment import Payment, PaymentSplit
 from .rating import Rating
 from .chat import ChatMessage
 from .admin import Admin
+from .system_notification import SystemNotification
+from .support import SupportRequest
 
 __all__ = [
     "User",
@@ -19,4 +21,6 @@ __all__ = [
     "Rating",
     "ChatMessage",
     "Admin",
+    "SystemNotification",
+    "SupportRequest",
 ]
@@ -12,6 +12,7 @@ class AdminRole(str, enum.Enum):
 
 class Admin(BaseModel):
     __tablename__ = "admins"
+    __repr_attrs__ = ("email", "name", "role")
 
     email = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
@@ -23,6 +24,3 @@ class Admin(BaseModel):
 
     # Relationships
     grouped_rides = relationship("GroupedRide", back_populates="admin")
-
-    def __repr__(self):
-        return f"<Admin(email={self.email}, name={self.name}, role={self.role})>"
@@ -1,16 +1,64 @@
+import os
+import time
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Integer, inspect
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary keys
+    land at the right-hand edge of the B-tree instead of at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76  # version
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+class Paise(TypeDecorator):
+    """Money stored as a 4-byte integer count of paise, exposed as rupees.
+
+    The database stores and sums exact integers; Python still sees float
+    rupees (rounded to the paisa on write), so callers keep reading and
+    writing plain rupee amounts.
+    """
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(round(value * 100))
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else value / 100
+
+
 class BaseModel(Base):
     __abstract__ = True
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Columns shown by __repr__; subclasses override
+    __repr_attrs__ = ("id",)
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        # Read loaded state only, so logging an expired or detached instance
+        # never triggers a lazy load (or a DetachedInstanceError)
+        loaded = inspect(self).dict
+        fields = ", ".join(
+            f"{name}={loaded[name] if name in loaded else '<unloaded>'}"
+            for name in self.__repr_attrs__
+        )
+        return f"<{type(self).__name__}({fields})>"
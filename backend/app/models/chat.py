@@ -6,8 +6,11 @@ from .base import BaseModel
 
 class ChatMessage(BaseModel):
     __tablename__ = "chat_messages"
+    __repr_attrs__ = ("grouped_ride_id", "user_id")
     
-    grouped_ride_id = Column(UUID(as_uuid=True), ForeignKey("grouped_rides.id"), nullable=False, index=True)
+    # Covered by the ix_chat_messages_grouped_ride_id_created_at composite index,
+    # which the table is also CLUSTERed on (see migration k0l1m2n3o4p5)
+    grouped_ride_id = Column(UUID(as_uuid=True), ForeignKey("grouped_rides.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     admin_id = Column(UUID(as_uuid=True), ForeignKey("admins.id"), nullable=True)
     content = Column(Text, nullable=False)
@@ -18,6 +21,3 @@ class ChatMessage(BaseModel):
     grouped_ride = relationship("GroupedRide", back_populates="chat_messages")
     user = relationship("User")
     admin = relationship("Admin")
-    
-    def __repr__(self):
-        return f"<ChatMessage(grouped_ride_id={self.grouped_ride_id}, user_id={self.user_id})>"
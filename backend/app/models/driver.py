@@ -7,6 +7,7 @@ from .base import BaseModel
 
 class Driver(BaseModel):
     __tablename__ = "drivers"
+    __repr_attrs__ = ("id", "name", "phone")
     
     # Driver is not linked to user anymore - standalone entity managed by admin
     name = Column(String(100), nullable=False)
@@ -39,6 +40,3 @@ class Driver(BaseModel):
     # Relationships
     grouped_rides = relationship("GroupedRide", back_populates="driver")
     ratings = relationship("Rating", back_populates="driver")
-    
-    def __repr__(self):
-        return f"<Driver(id={self.id}, name={self.name}, phone={self.phone})>"
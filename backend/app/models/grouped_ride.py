@@ -1,12 +1,13 @@
-from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 
-from .base import BaseModel
+from .base import BaseModel, Paise
 
 
 class GroupedRide(BaseModel):
     __tablename__ = "grouped_rides"
+    __repr_attrs__ = ("id", "driver_id", "status")
     
     # Admin who created the group
     admin_id = Column(UUID(as_uuid=True), ForeignKey("admins.id"), nullable=False)
@@ -20,11 +21,14 @@ class GroupedRide(BaseModel):
     pickup_location = Column(String(500), nullable=True)
     
     # Pricing for savings calculation
-    actual_price = Column(Float, nullable=True)  # What it would normally cost
-    charged_price = Column(Float, nullable=True)  # What users are charged
+    actual_price = Column(Paise, nullable=True)  # What it would normally cost
+    charged_price = Column(Paise, nullable=True)  # What users are charged
     
     # Seat management (excluding driver)
     total_seats = Column(Integer, default=4, nullable=False)
+    # Number of requests on the ride, filled in by queries that ask for it
+    # via with_expression(GroupedRide.occupied_seats, ...); None otherwise.
+    occupied_seats = query_expression()
     
     # Railway station trip flags
     is_railway_station_trip = Column(Boolean, default=False, nullable=False)
@@ -41,6 +45,3 @@ class GroupedRide(BaseModel):
     ratings = relationship("Rating", back_populates="grouped_ride", cascade="all, delete-orphan")
     payment = relationship("Payment", back_populates="grouped_ride", uselist=False, cascade="all, delete-orphan")
     chat_messages = relationship("ChatMessage", back_populates="grouped_ride", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<GroupedRide(id={self.id}, driver_id={self.driver_id}, status={self.status})>"
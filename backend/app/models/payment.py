@@ -25,6 +25,7 @@ class SplitStatus(PyEnum):
 
 class Payment(BaseModel):
     __tablename__ = "payments"
+    __repr_attrs__ = ("grouped_ride_id", "total_fare", "status")
     
     grouped_ride_id = Column(UUID(as_uuid=True), ForeignKey("grouped_rides.id"), nullable=False, unique=True)
     total_fare = Column(Float, nullable=False)
@@ -37,13 +38,11 @@ class Payment(BaseModel):
     # Relationships
     grouped_ride = relationship("GroupedRide", back_populates="payment")
     splits = relationship("PaymentSplit", back_populates="payment", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<Payment(grouped_ride_id={self.grouped_ride_id}, total_fare={self.total_fare}, status={self.status})>"
 
 
 class PaymentSplit(BaseModel):
     __tablename__ = "payment_splits"
+    __repr_attrs__ = ("payment_id", "user_id", "amount")
     
     payment_id = Column(UUID(as_uuid=True), ForeignKey("payments.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -54,6 +53,3 @@ class PaymentSplit(BaseModel):
     # Relationships
     payment = relationship("Payment", back_populates="splits")
     user = relationship("User")
-    
-    def __repr__(self):
-        return f"<PaymentSplit(payment_id={self.payment_id}, user_id={self.user_id}, amount={self.amount})>"
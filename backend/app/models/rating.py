@@ -7,6 +7,7 @@ from .base import BaseModel
 
 class Rating(BaseModel):
     __tablename__ = "ratings"
+    __repr_attrs__ = ("id", "user_id", "driver_id", "rating")
     
     # User giving the rating
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -20,12 +21,10 @@ class Rating(BaseModel):
     # Rating details
     rating = Column(Integer, nullable=False)  # 1-5 stars
     comment = Column(Text, nullable=True)
-    testimonial_text = Column(Text, nullable=True)  # Generated testimonial for WhatsApp
+    # The shareable WhatsApp testimonial is not stored: it is rebuilt from the
+    # rating, ride and user when needed (see routes/user_rides.py)
     
     # Relationships
     user = relationship("User", back_populates="ratings_given")
     driver = relationship("Driver", back_populates="ratings")
     grouped_ride = relationship("GroupedRide", back_populates="ratings")
-    
-    def __repr__(self):
-        return f"<Rating(id={self.id}, user_id={self.user_id}, driver_id={self.driver_id}, rating={self.rating})>"
@@ -1,13 +1,14 @@
 from sqlalchemy import Column, String, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.sql import func
 
 from .base import BaseModel
 
 
 class RideNotification(BaseModel):
     __tablename__ = "ride_notifications"
+    __repr_attrs__ = ("id", "user_id", "notification_type", "status")
     
     # User receiving the notification
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -22,12 +23,9 @@ class RideNotification(BaseModel):
     status = Column(String(20), default="pending", index=True)
     
     # Timestamps
-    sent_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    sent_at = Column(DateTime(timezone=True), server_default=func.now())
     responded_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="notifications")
     grouped_ride = relationship("GroupedRide", back_populates="notifications")
-    
-    def __repr__(self):
-        return f"<RideNotification(id={self.id}, user_id={self.user_id}, type={self.notification_type}, status={self.status})>"
@@ -1,13 +1,25 @@
-from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Text, ForeignKey, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import enum
 
 from .base import BaseModel
 
 
+class RideRequestStatus(enum.StrEnum):
+    PENDING = "pending"
+    GROUPED = "grouped"
+    ASSIGNED = "assigned"
+    ACCEPTED = "accepted"
+    REJECTED = "rejected"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
 class RideRequest(BaseModel):
     __tablename__ = "ride_requests"
+    __repr_attrs__ = ("id", "user_id", "status")
     
     # User who requested the ride
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -31,8 +43,15 @@ class RideRequest(BaseModel):
     passenger_count = Column(Integer, default=1, nullable=False)
     additional_info = Column(Text, nullable=True)
     
-    # Status: pending, grouped, assigned, accepted, rejected, completed, cancelled
-    status = Column(String(20), default="pending", index=True)
+    # Native ride_request_status enum (4 bytes). StrEnum members compare equal to
+    # the plain strings the routes use, so callers can keep passing "pending" etc.
+    status = Column(
+        SQLEnum(
+            RideRequestStatus, name="ride_request_status",
+            values_callable=lambda members: [m.value for m in members],
+        ),
+        default=RideRequestStatus.PENDING, index=True,
+    )
     
     # Link to grouped ride (if assigned)
     grouped_ride_id = Column(UUID(as_uuid=True), ForeignKey("grouped_rides.id"), nullable=True)
@@ -40,6 +59,3 @@ class RideRequest(BaseModel):
     # Relationships
     user = relationship("User", back_populates="ride_requests")
     grouped_ride = relationship("GroupedRide", back_populates="ride_requests")
-    
-    def __repr__(self):
-        return f"<RideRequest(id={self.id}, user_id={self.user_id}, status={self.status})>"
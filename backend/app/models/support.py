@@ -7,6 +7,7 @@ from .base import BaseModel
 
 class SupportRequest(BaseModel):
     __tablename__ = "support_requests"
+    __repr_attrs__ = ("id", "type", "user_id")
     
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     type = Column(String(20), nullable=False) # issue, feature, call
@@ -16,6 +17,3 @@ class SupportRequest(BaseModel):
     
     # Relationships
     user = relationship("User", back_populates="support_requests")
-    
-    def __repr__(self):
-        return f"<SupportRequest(id={self.id}, type={self.type}, user_id={self.user_id})>"
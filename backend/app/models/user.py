@@ -1,15 +1,18 @@
 from sqlalchemy import Column, String, Float, Integer, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
-from .base import BaseModel
+from .base import BaseModel, Paise
 
 
 class User(BaseModel):
     __tablename__ = "users"
+    __repr_attrs__ = ("phone", "name")
     
     phone = Column(String(20), unique=True, index=True, nullable=True)
     email = Column(String(255), unique=True, index=True, nullable=True)
-    hashed_password = Column(String(255), nullable=True)
+    # Only password login reads the hash; deferred so the per-request user load
+    # (and the cached snapshot in core/auth.py) never fetches it
+    hashed_password = deferred(Column(String(255), nullable=True))
     name = Column(String(100), nullable=True)
     avatar_url = Column(String(500), nullable=True)
     whatsapp_number = Column(String(20), nullable=True)
@@ -20,7 +23,7 @@ class User(BaseModel):
     
     # Ride statistics
     total_rides = Column(Integer, default=0)
-    total_savings = Column(Float, default=0.0)
+    total_savings = Column(Paise, default=0.0)
     
     # Rating (average from all rides)
     rating = Column(Float, default=0.0)
@@ -32,6 +35,3 @@ class User(BaseModel):
     system_notifications = relationship("SystemNotification", back_populates="user")
     ratings_given = relationship("Rating", foreign_keys="Rating.user_id", back_populates="user")
     support_requests = relationship("SupportRequest", back_populates="user")
-    
-    def __repr__(self):
-        return f"<User(phone={self.phone}, name={self.name})>"
@@ -1,5 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import threading
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import exists, func, or_, select
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload, with_expression
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -8,22 +13,40 @@ from ..core.auth import (
     get_current_admin,
     create_admin_token,
     get_password_hash,
+    invalidate_cached_user,
+    load_user,
+    password_needs_rehash,
     verify_password,
 )
-from ..models.admin import Admin
+from ..models.admin import Admin, AdminRole
 from ..models.user import User
 from ..models.driver import Driver
 from ..models.grouped_ride import GroupedRide
-from ..models.ride_request import RideRequest
-from ..schemas.auth import AdminLogin, AdminToken, DriverCreate
+from ..models.ride_request import RideRequest, RideRequestStatus
+from ..models.ride_notification import RideNotification
+from ..models.system_notification import SystemNotification
+from ..models.support import SupportRequest
+from ..schemas.auth import AdminCreate, AdminLogin, AdminToken, DriverCreate
+from ..schemas.driver import DriverUpdate
 from ..schemas.grouped_ride import GroupedRideAdminCreate, GroupedRideMerge
 from ..schemas.user import User as UserSchema
+from .chat import invalidate_chat_members
+from ..utils.bulk import group_pending_requests, insert_rows
+from ..utils.pagination import keyset_page
+
+# Requests on a ride, counted in SQL next to each grouped_rides row
+_OCCUPIED_SEATS = (
+    select(func.count(RideRequest.id))
+    .where(RideRequest.grouped_ride_id == GroupedRide.id)
+    .correlate(GroupedRide)
+    .scalar_subquery()
+)
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
 
 @router.post("/login", response_model=AdminToken)
-async def admin_login(request: AdminLogin, db: Session = Depends(get_db)):
+def admin_login(request: AdminLogin, db: Session = Depends(get_db)):
     """Admin login with email and password"""
     admin = db.query(Admin).filter(Admin.email == request.email).first()
     
@@ -38,33 +61,35 @@ async def admin_login(request: AdminLogin, db: Session = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive admin account"
         )
+
+    if password_needs_rehash(admin.hashed_password):
+        admin.hashed_password = get_password_hash(request.password)
+        db.commit()
     
     token = create_admin_token(str(admin.id))
     return AdminToken(access_token=token)
 
 
 @router.post("/drivers", status_code=status.HTTP_201_CREATED)
-async def create_driver(
+def create_driver(
     request: DriverCreate,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """Create a new driver (admin only)"""
-    # Check if driver with phone already exists
-    existing_driver = db.query(Driver).filter(Driver.phone == request.phone).first()
-    if existing_driver:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Driver with this phone number already exists"
-        )
-    
+    # Check phone and email uniqueness in one round trip
+    clash = Driver.phone == request.phone
     if request.email:
-        existing_email = db.query(Driver).filter(Driver.email == request.email).first()
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Driver with this email already exists"
-            )
+        clash = or_(clash, Driver.email == request.email)
+    existing_driver = db.query(Driver).options(
+        load_only(Driver.phone, Driver.email)
+    ).filter(clash).first()
+    if existing_driver:
+        if existing_driver.phone == request.phone:
+            detail = "Driver with this phone number already exists"
+        else:
+            detail = "Driver with this email already exists"
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
     
     # Create standalone driver entity
     # Convert empty strings to None for optional fields to avoid unique constraint issues
@@ -95,26 +120,29 @@ async def create_driver(
 
 
 @router.get("/users", response_model=List[UserSchema])
-async def list_users(
-    skip: int = Query(0, ge=0),
+def list_users(
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    """List all users with pagination (admin only)"""
-    query = db.query(User)
-    users = query.offset(skip).limit(limit).all()
-    return [UserSchema.from_orm(user) for user in users]
+    """List all users, newest first, with cursor pagination (admin only)"""
+    users = keyset_page(db.query(User), User, cursor, limit, response, skip)
+    # response_model validates the rows once; no per-row from_orm first
+    return users
 
 
 @router.get("/users/{user_id}", response_model=UserSchema)
-async def get_user(
+def get_user(
     user_id: str,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """Get user details (admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    # Served from the short-lived user snapshot cache shared with auth
+    user = load_user(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -124,7 +152,7 @@ async def get_user(
 
 
 @router.post("/users/{user_id}/notify-phone")
-async def notify_user_phone(
+def notify_user_phone(
     user_id: str,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
@@ -150,8 +178,6 @@ async def notify_user_phone(
         )
         
     # Create System Notification
-    from ..models.system_notification import SystemNotification
-    
     notification = SystemNotification(
         user_id=user.id,
         title="Phone Number Required",
@@ -168,7 +194,7 @@ class NotificationRequest(BaseModel):
     message: str
 
 @router.post("/users/{user_id}/notify")
-async def send_custom_notification(
+def send_custom_notification(
     user_id: str,
     notification: NotificationRequest,
     db: Session = Depends(get_db),
@@ -181,8 +207,6 @@ async def send_custom_notification(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-        
-    from ..models.system_notification import SystemNotification
     
     sys_notification = SystemNotification(
         user_id=user.id,
@@ -196,7 +220,7 @@ async def send_custom_notification(
 
 
 @router.delete("/users/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: str,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
@@ -215,18 +239,18 @@ async def delete_user(
     
     db.delete(user)
     db.commit()
+    invalidate_cached_user(user.id)
     
     return {"message": "User deleted successfully"}
 
 
 @router.delete("/requests/{request_id}")
-async def delete_ride_request(
+def delete_ride_request(
     request_id: str,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """Delete a ride request"""
-    from ..models.ride_request import RideRequest
     request = db.query(RideRequest).filter(RideRequest.id == request_id).first()
     if not request:
         raise HTTPException(
@@ -241,13 +265,12 @@ async def delete_ride_request(
 
 
 @router.delete("/support/{request_id}")
-async def delete_support_request(
+def delete_support_request(
     request_id: str,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """Delete a support request"""
-    from ..models.support import SupportRequest
     request = db.query(SupportRequest).filter(SupportRequest.id == request_id).first()
     if not request:
         raise HTTPException(
@@ -262,9 +285,11 @@ async def delete_support_request(
 
 
 @router.get("/drivers")
-async def list_drivers(
-    skip: int = Query(0, ge=0),
+def list_drivers(
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
     is_verified: Optional[bool] = None,
     availability_status: Optional[str] = None,
     sort_by: Optional[str] = None,
@@ -281,12 +306,12 @@ async def list_drivers(
         query = query.filter(Driver.availability_status == availability_status)
         
     if sort_by == "queue":
-        # Sort by assigned_rides_count ASC (fairness) and then updated_at
+        # Sort by assigned_rides_count ASC (fairness) and then updated_at;
+        # this ordering has no stable key to resume from, so it keeps OFFSET
         query = query.order_by(Driver.assigned_rides_count.asc(), Driver.updated_at.asc())
+        drivers = query.offset(skip).limit(limit).all()
     else:
-        query = query.order_by(Driver.created_at.desc())
-    
-    drivers = query.offset(skip).limit(limit).all()
+        drivers = keyset_page(query, Driver, cursor, limit, response, skip)
     
     # Return driver data
     result = []
@@ -316,15 +341,13 @@ async def list_drivers(
 
 
 @router.patch("/drivers/{driver_id}")
-async def update_driver(
+def update_driver(
     driver_id: str,
-    driver_update: "DriverUpdate",
+    driver_update: DriverUpdate,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """Update driver details (admin only)"""
-    from ..schemas.driver import DriverUpdate
-    
     driver = db.query(Driver).filter(Driver.id == driver_id).first()
     if not driver:
         raise HTTPException(
@@ -408,23 +431,27 @@ async def update_driver(
 
 
 @router.get("/ride-requests")
-async def list_ride_requests(
-    skip: int = Query(0, ge=0),
+def list_ride_requests(
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(50, ge=1, le=1000),
-    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    status: Optional[RideRequestStatus] = None,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """List all ride requests with pagination (admin only)"""
-    query = db.query(RideRequest)
+    # Each row reports its requester; batch those users into one IN query
+    query = db.query(RideRequest).options(
+        selectinload(RideRequest.user),
+        raiseload("*"),
+    )
     
     if status:
         query = query.filter(RideRequest.status == status)
     
-    # Order by created_at desc
-    query = query.order_by(RideRequest.created_at.desc())
-    
-    requests = query.offset(skip).limit(limit).all()
+    # Newest first
+    requests = keyset_page(query, RideRequest, cursor, limit, response, skip)
     
     result = []
     for req in requests:
@@ -453,7 +480,7 @@ async def list_ride_requests(
 
 
 @router.post("/trips/create", status_code=status.HTTP_201_CREATED)
-async def create_grouped_ride(
+def create_grouped_ride(
     request: GroupedRideAdminCreate,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
@@ -468,7 +495,9 @@ async def create_grouped_ride(
         )
     
     # Verify requests exist and are pending
-    ride_requests = db.query(RideRequest).filter(RideRequest.id.in_(request.ride_request_ids)).all()
+    ride_requests = db.query(RideRequest).options(
+        load_only(RideRequest.id, RideRequest.user_id, RideRequest.status)
+    ).filter(RideRequest.id.in_(request.ride_request_ids)).all()
     if len(ride_requests) != len(request.ride_request_ids):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -504,29 +533,32 @@ async def create_grouped_ride(
     
     
     # Update requests and create notifications
-    from ..models.ride_notification import RideNotification
-    from ..models.system_notification import SystemNotification
-    
-    for req in ride_requests:
-        req.grouped_ride_id = grouped_ride.id
-        req.status = "grouped"
-        
-        # Create ride assignment notification
-        notification = RideNotification(
-            user_id=req.user_id,
-            grouped_ride_id=grouped_ride.id,
-            notification_type="ride_assignment",
-            status="pending"
-        )
-        db.add(notification)
-        
-        # Create system notification about group chat
-        chat_notification = SystemNotification(
-            user_id=req.user_id,
-            title="Group Chat Available",
-            message=f"Your ride has been grouped! You can now chat with other passengers and the driver. Please accept or reject the ride assignment."
+    # One UPDATE for all requests; the pending guard catches a request that
+    # was grouped or cancelled since it was read above
+    if group_pending_requests(db, request.ride_request_ids, grouped_ride.id) != len(ride_requests):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="One or more ride requests are no longer pending"
         )
-        db.add(chat_notification)
+    
+    # Ride assignment and group chat notifications, one batched INSERT each
+    insert_rows(db, RideNotification, [
+        {
+            "user_id": req.user_id,
+            "grouped_ride_id": grouped_ride.id,
+            "notification_type": "ride_assignment",
+            "status": "pending",
+        }
+        for req in ride_requests
+    ])
+    insert_rows(db, SystemNotification, [
+        {
+            "user_id": req.user_id,
+            "title": "Group Chat Available",
+            "message": "Your ride has been grouped! You can now chat with other passengers and the driver. Please accept or reject the ride assignment.",
+        }
+        for req in ride_requests
+    ])
     
     db.commit()
     db.refresh(grouped_ride)
@@ -535,7 +567,7 @@ async def create_grouped_ride(
 
 
 @router.post("/trips/{grouped_ride_id}/merge")
-async def merge_requests_to_trip(
+def merge_requests_to_trip(
     grouped_ride_id: str,
     request: GroupedRideMerge,
     db: Session = Depends(get_db),
@@ -551,7 +583,9 @@ async def merge_requests_to_trip(
         )
         
     # Verify requests exist and are pending
-    ride_requests = db.query(RideRequest).filter(RideRequest.id.in_(request.ride_request_ids)).all()
+    ride_requests = db.query(RideRequest).options(
+        load_only(RideRequest.id, RideRequest.user_id, RideRequest.status)
+    ).filter(RideRequest.id.in_(request.ride_request_ids)).all()
     if len(ride_requests) != len(request.ride_request_ids):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -566,29 +600,32 @@ async def merge_requests_to_trip(
             )
             
     # Update requests and create notifications
-    from ..models.ride_notification import RideNotification
-    from ..models.system_notification import SystemNotification
-    
-    for req in ride_requests:
-        req.grouped_ride_id = grouped_ride.id
-        req.status = "grouped"
-        
-        # Create ride assignment notification
-        notification = RideNotification(
-            user_id=req.user_id,
-            grouped_ride_id=grouped_ride.id,
-            notification_type="ride_assignment",
-            status="pending"
-        )
-        db.add(notification)
-        
-        # Create system notification about group chat
-        chat_notification = SystemNotification(
-            user_id=req.user_id,
-            title="Group Chat Available",
-            message=f"Your ride has been grouped! You can now chat with other passengers and the driver. Please accept or reject the ride assignment."
+    # One UPDATE for all requests; the pending guard catches a request that
+    # was grouped or cancelled since it was read above
+    if group_pending_requests(db, request.ride_request_ids, grouped_ride.id) != len(ride_requests):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="One or more ride requests are no longer pending"
         )
-        db.add(chat_notification)
+    
+    # Ride assignment and group chat notifications, one batched INSERT each
+    insert_rows(db, RideNotification, [
+        {
+            "user_id": req.user_id,
+            "grouped_ride_id": grouped_ride.id,
+            "notification_type": "ride_assignment",
+            "status": "pending",
+        }
+        for req in ride_requests
+    ])
+    insert_rows(db, SystemNotification, [
+        {
+            "user_id": req.user_id,
+            "title": "Group Chat Available",
+            "message": "Your ride has been grouped! You can now chat with other passengers and the driver. Please accept or reject the ride assignment.",
+        }
+        for req in ride_requests
+    ])
         
     db.commit()
     
@@ -596,31 +633,37 @@ async def merge_requests_to_trip(
 
 
 @router.get("/trips")
-async def list_rides(
-    skip: int = Query(0, ge=0),
+def list_rides(
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     date: Optional[str] = None,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """List all grouped rides with pagination (admin only)"""
-    query = db.query(GroupedRide)
+    # Seat counts and driver names are read for every row: count requests in
+    # SQL instead of loading them, join the driver, and fail loudly on any
+    # other lazy load.
+    query = db.query(GroupedRide).options(
+        with_expression(GroupedRide.occupied_seats, _OCCUPIED_SEATS),
+        joinedload(GroupedRide.driver),
+        raiseload("*"),
+    )
     
     if status:
         query = query.filter(GroupedRide.status == status)
         
     if date:
-        from sqlalchemy import func
         query = query.filter(func.date(GroupedRide.pickup_time) == date)
         
-    query = query.order_by(GroupedRide.created_at.desc())
-    
-    rides = query.offset(skip).limit(limit).all()
+    rides = keyset_page(query, GroupedRide, cursor, limit, response, skip)
     
     result = []
     for ride in rides:
-        occupied_seats = len(ride.ride_requests) if ride.ride_requests else 0
+        occupied_seats = ride.occupied_seats
         available_seats = ride.total_seats - occupied_seats
         
         ride_data = {
@@ -646,13 +689,16 @@ async def list_rides(
 
 
 @router.get("/trips/{ride_id}")
-async def get_ride(
+def get_ride(
     ride_id: str,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
     """Get ride details (admin only)"""
-    ride = db.query(GroupedRide).filter(GroupedRide.id == ride_id).first()
+    ride = db.query(GroupedRide).options(
+        with_expression(GroupedRide.occupied_seats, _OCCUPIED_SEATS),
+        joinedload(GroupedRide.driver),
+    ).filter(GroupedRide.id == ride_id).first()
     if not ride:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -667,7 +713,7 @@ async def get_ride(
         "destination": ride.destination_address,
         "scheduled_time": ride.pickup_time.isoformat() if ride.pickup_time else None,
         "total_seats": 4,
-        "available_seats": 4 - len(ride.ride_requests) if ride.ride_requests else 4,
+        "available_seats": 4 - ride.occupied_seats,
         "fare_per_seat": float(ride.charged_price) if ride.charged_price else None,
         "status": ride.status,
         "created_at": ride.created_at.isoformat(),
@@ -676,13 +722,7 @@ async def get_ride(
     return ride_data
 
 
-@router.delete("/trips/{trip_id}")
-async def delete_trip(
-    trip_id: str,
-    db: Session = Depends(get_db),
-    admin: Admin = Depends(get_current_admin)
-):
-    """Delete a grouped ride (admin only)"""
+def _delete_trip(db: Session, trip_id: str):
     grouped_ride = db.query(GroupedRide).filter(GroupedRide.id == trip_id).first()
     if not grouped_ride:
         raise HTTPException(
@@ -692,6 +732,7 @@ async def delete_trip(
     
     # Store driver info before deletion for stat update
     driver_id = grouped_ride.driver_id
+    grouped_ride_id = grouped_ride.id
     
     # Get all associated ride requests
     affected_users = []
@@ -712,16 +753,31 @@ async def delete_trip(
             driver.assigned_rides_count -= 1
     
     # Send notifications to affected users
-    from ..models.system_notification import SystemNotification
-    for user_id in affected_users:
-        notification = SystemNotification(
-            user_id=user_id,
-            title="Trip Cancelled",
-            message="Your grouped trip has been cancelled by the admin. Your ride request has been reset to pending and will be re-grouped."
-        )
-        db.add(notification)
+    insert_rows(db, SystemNotification, [
+        {
+            "user_id": user_id,
+            "title": "Trip Cancelled",
+            "message": "Your grouped trip has been cancelled by the admin. Your ride request has been reset to pending and will be re-grouped.",
+        }
+        for user_id in affected_users
+    ])
     
     db.commit()
+    return grouped_ride_id, affected_users
+
+
+
+
+@router.delete("/trips/{trip_id}")
+async def delete_trip(
+    trip_id: str,
+    db: Session = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+):
+    """Delete a grouped ride (admin only)"""
+    # The Session is synchronous; keep its queries off the event loop
+    grouped_ride_id, affected_users = await run_in_threadpool(_delete_trip, db, trip_id)
+    await invalidate_chat_members(grouped_ride_id, affected_users)
     
     return {"message": "Trip deleted successfully", "affected_users": len(affected_users)}
 
@@ -729,7 +785,6 @@ async def delete_trip(
 # Admin user management endpoints
 async def get_super_admin(admin: Admin = Depends(get_current_admin)) -> Admin:
     """Dependency to ensure current admin is a super admin"""
-    from ..models.admin import AdminRole
     if admin.role != AdminRole.SUPER_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -738,15 +793,31 @@ async def get_super_admin(admin: Admin = Depends(get_current_admin)) -> Admin:
     return admin
 
 
+# The dashboard polls the admin list, which only changes through the two
+# endpoints below. Other workers may serve it up to the TTL stale.
+_admin_list_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+_admin_list_lock = threading.Lock()
+
+
+def _invalidate_admin_list() -> None:
+    with _admin_list_lock:
+        _admin_list_cache.clear()
+
+
 @router.get("/admins")
-async def list_admins(
+def list_admins(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_super_admin)
 ):
     """List all admin users (super admin only)"""
+    with _admin_list_lock:
+        cached = _admin_list_cache.get("admins")
+    if cached is not None:
+        return cached
+
     admins = db.query(Admin).all()
     
-    return [
+    result = [
         {
             "id": str(a.id),
             "email": a.email,
@@ -757,48 +828,37 @@ async def list_admins(
         }
         for a in admins
     ]
+    with _admin_list_lock:
+        _admin_list_cache["admins"] = result
+    return result
 
 
 @router.post("/admins", status_code=status.HTTP_201_CREATED)
-async def create_admin(
-    email: str,
-    password: str,
-    name: str,
-    role: str = "admin",
+def create_admin(
+    request: AdminCreate,
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_super_admin)
 ):
     """Create a new admin user (super admin only)"""
-    from ..models.admin import AdminRole
-    
     # Check if admin already exists
-    existing = db.query(Admin).filter(Admin.email == email).first()
-    if existing:
+    if db.scalar(select(exists().where(Admin.email == request.email))):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Admin with this email already exists"
         )
     
-    # Validate role
-    try:
-        admin_role = AdminRole(role)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role. Must be one of: {[r.value for r in AdminRole]}"
-        )
-    
     # Create new admin
     new_admin = Admin(
-        email=email,
-        hashed_password=get_password_hash(password),
-        name=name,
-        role=admin_role,
+        email=request.email,
+        hashed_password=get_password_hash(request.password),
+        name=request.name,
+        role=request.role,
         is_active=True,
     )
     
     db.add(new_admin)
     db.commit()
+    _invalidate_admin_list()
     db.refresh(new_admin)
     
     return {
@@ -811,7 +871,7 @@ async def create_admin(
 
 
 @router.delete("/admins/{admin_id}")
-async def delete_admin(
+def delete_admin(
     admin_id: str,
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_super_admin)
@@ -833,5 +893,6 @@ async def delete_admin(
     
     db.delete(admin_to_delete)
     db.commit()
+    _invalidate_admin_list()
     
     return {"message": "Admin deleted successfully"}
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from datetime import datetime
 
@@ -19,37 +20,44 @@ from ..schemas.grouped_ride import (
     PricingUpdate,
     GroupedRideUpdate
 )
+from ..utils.bulk import group_pending_requests, insert_rows
 
 router = APIRouter(prefix="/api/admin/rides", tags=["Admin - Rides"])
 
+# The grouping queue is polled constantly; build its statement once. Each row
+# is rendered with its user, so load them in one IN query rather than per row.
+_PENDING_REQUESTS_QUERY = select(RideRequest).options(
+    selectinload(RideRequest.user)
+).where(
+    RideRequest.status == "pending"
+).order_by(RideRequest.requested_time)
+
 
 @router.get("/requests", response_model=List[RideRequestWithUser])
-async def get_pending_requests(
+def get_pending_requests(
     current_admin: Admin = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get all pending ride requests for grouping"""
-    requests = db.query(RideRequest).filter(
-        RideRequest.status == "pending"
-    ).order_by(RideRequest.requested_time).all()
+    requests = db.scalars(_PENDING_REQUESTS_QUERY).all()
     
-    return [RideRequestWithUser.from_orm(req) for req in requests]
+    return requests
 
 
 @router.post("/grouped-rides", response_model=GroupedRideSchema, status_code=status.HTTP_201_CREATED)
-async def create_grouped_ride(
+def create_grouped_ride(
     ride_data: GroupedRideCreate,
     current_admin: Admin = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Admin creates a grouped ride from multiple requests"""
     # Verify all ride requests exist and are pending
-    ride_requests = db.query(RideRequest).filter(
+    pending_count = db.query(RideRequest).filter(
         RideRequest.id.in_(ride_data.ride_request_ids),
         RideRequest.status == "pending"
-    ).all()
+    ).count()
     
-    if len(ride_requests) != len(ride_data.ride_request_ids):
+    if pending_count != len(ride_data.ride_request_ids):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Some ride requests not found or not pending"
@@ -65,10 +73,13 @@ async def create_grouped_ride(
     db.add(grouped_ride)
     db.flush()
     
-    # Update ride requests to link to grouped ride
-    for request in ride_requests:
-        request.status = "grouped"
-        request.grouped_ride_id = grouped_ride.id
+    # Link all requests in one UPDATE; the pending guard catches a request
+    # that changed since the check above
+    if group_pending_requests(db, ride_data.ride_request_ids, grouped_ride.id) != pending_count:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Some ride requests are no longer pending"
+        )
     
     db.commit()
     db.refresh(grouped_ride)
@@ -77,7 +88,7 @@ async def create_grouped_ride(
 
 
 @router.put("/grouped-rides/{ride_id}/assign-driver", response_model=GroupedRideSchema)
-async def assign_driver(
+def assign_driver(
     ride_id: str,
     assignment: RideAssignment,
     current_admin: Admin = Depends(get_current_admin),
@@ -108,15 +119,17 @@ async def assign_driver(
     grouped_ride.driver_id = assignment.driver_id
     grouped_ride.status = "pending_acceptance"
     
-    # Create notifications for all users in this ride
+    # Create notifications for all users in this ride (one batched INSERT)
+    insert_rows(db, RideNotification, [
+        {
+            "user_id": ride_request.user_id,
+            "grouped_ride_id": grouped_ride.id,
+            "notification_type": "ride_assignment",
+            "status": "pending",
+        }
+        for ride_request in grouped_ride.ride_requests
+    ])
     for ride_request in grouped_ride.ride_requests:
-        notification = RideNotification(
-            user_id=ride_request.user_id,
-            grouped_ride_id=grouped_ride.id,
-            notification_type="ride_assignment",
-            status="pending"
-        )
-        db.add(notification)
         ride_request.status = "assigned"
     
     # Update driver stats
@@ -129,7 +142,7 @@ async def assign_driver(
 
 
 @router.put("/grouped-rides/{ride_id}/pricing", response_model=GroupedRideSchema)
-async def update_pricing(
+def update_pricing(
     ride_id: str,
     pricing: PricingUpdate,
     current_admin: Admin = Depends(get_current_admin),
@@ -154,17 +167,17 @@ async def update_pricing(
 
 
 @router.get("/grouped-rides", response_model=List[GroupedRideSchema])
-async def get_grouped_rides(
+def get_grouped_rides(
     current_admin: Admin = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get all grouped rides"""
     rides = db.query(GroupedRide).order_by(GroupedRide.created_at.desc()).all()
-    return [GroupedRideSchema.from_orm(ride) for ride in rides]
+    return rides
 
 
 @router.put("/grouped-rides/{ride_id}", response_model=GroupedRideSchema)
-async def update_grouped_ride(
+def update_grouped_ride(
     ride_id: str,
     update_data: GroupedRideUpdate,
     current_admin: Admin = Depends(get_current_admin),
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/api/admin/analytics", tags=["Analytics"])
 
 
 @router.get("/overview")
-async def get_overview(
+def get_overview(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -66,7 +66,7 @@ async def get_overview(
 
 
 @router.get("/trips-timeline")
-async def get_trips_timeline(
+def get_trips_timeline(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     interval: str = "day",  # day, week, month
@@ -104,7 +104,7 @@ async def get_trips_timeline(
 
 
 @router.get("/revenue")
-async def get_revenue_stats(
+def get_revenue_stats(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -144,7 +144,7 @@ async def get_revenue_stats(
 
 
 @router.get("/drivers")
-async def get_driver_performance(
+def get_driver_performance(
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
@@ -169,7 +169,7 @@ async def get_driver_performance(
 
 
 @router.get("/status-distribution")
-async def get_status_distribution(
+def get_status_distribution(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     db: Session = Depends(get_db),
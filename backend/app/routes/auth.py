@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, or_, select
+from sqlalchemy.orm import Session, undefer
 
 from ..core.database import get_db
 from ..core.config import settings
@@ -10,6 +12,8 @@ from ..core.auth import (
     email_verification_service,
     create_access_token,
     get_password_hash,
+    invalidate_cached_user,
+    password_needs_rehash,
     verify_password,
     get_current_user,
 )
@@ -29,16 +33,19 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 
 @router.put("/me", response_model=UserSchema)
-async def update_user_me(
+def update_user_me(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update current user details."""
     if user_update.phone:
-        # Check if phone is already taken
-        existing_user = db.query(User).filter(User.phone == user_update.phone).first()
-        if existing_user and existing_user.id != current_user.id:
+        # Check if phone is already taken by someone else
+        phone_taken = db.scalar(select(exists().where(
+            User.phone == user_update.phone,
+            User.id != current_user.id,
+        )))
+        if phone_taken:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Phone number already in use"
@@ -56,12 +63,13 @@ async def update_user_me(
         current_user.hashed_password = get_password_hash(user_update.password)
         
     db.commit()
+    invalidate_cached_user(current_user.id)
     db.refresh(current_user)
     return current_user
 
 
 @router.post("/otp", response_model=dict)
-async def send_otp(request: OTPRequest, db: Session = Depends(get_db)):
+async def send_otp(request: OTPRequest):
     """Send OTP to phone number for authentication"""
     try:
         request_id = await otp_service.send_otp(request.phone)
@@ -76,18 +84,8 @@ async def send_otp(request: OTPRequest, db: Session = Depends(get_db)):
         )
 
 
-@router.post("/verify", response_model=Token)
-async def verify_otp(request: OTPVerify, db: Session = Depends(get_db)):
-    """Verify OTP and complete authentication."""
-    # Check if OTP is valid
-    is_valid = await otp_service.verify_otp(request.request_id, request.phone, request.otp)
-    
-    if not is_valid:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired OTP"
-        )
-
+def _verified_phone_user(db: Session, request: OTPVerify) -> User:
+    """Load or create the user behind a verified OTP and mark the phone verified."""
     # Check if user exists
     user = db.query(User).filter(User.phone == request.phone).first()
 
@@ -115,6 +113,25 @@ async def verify_otp(request: OTPVerify, db: Session = Depends(get_db)):
         user.is_phone_verified = True
         user.is_verified = user.is_phone_verified or user.is_email_verified
         db.commit()
+        invalidate_cached_user(user.id)
+        db.refresh(user)
+    return user
+
+
+@router.post("/verify", response_model=Token)
+async def verify_otp(request: OTPVerify, db: Session = Depends(get_db)):
+    """Verify OTP and complete authentication."""
+    # Check if OTP is valid
+    is_valid = await otp_service.verify_otp(request.request_id, request.phone, request.otp)
+    
+    if not is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired OTP"
+        )
+
+    # The Session is synchronous; keep its queries off the event loop
+    user = await run_in_threadpool(_verified_phone_user, db, request)
     
     # Create access token
     token = create_access_token({"sub": str(user.id)})
@@ -126,7 +143,7 @@ async def verify_otp(request: OTPVerify, db: Session = Depends(get_db)):
 
 
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
+def signup(request: SignUpRequest, db: Session = Depends(get_db)):
     """Sign up with phone/email and password (password-based auth)."""
     if not request.phone and not request.email:
         raise HTTPException(
@@ -134,13 +151,14 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
             detail="Phone or email is required"
         )
 
-    existing_user = None
+    # One EXISTS probe for either identifier; no user row is loaded
+    identifiers = []
     if request.phone:
-        existing_user = db.query(User).filter(User.phone == request.phone).first()
-    if not existing_user and request.email:
-        existing_user = db.query(User).filter(User.email == request.email).first()
+        identifiers.append(User.phone == request.phone)
+    if request.email:
+        identifiers.append(User.email == request.email)
 
-    if existing_user:
+    if db.scalar(select(exists().where(or_(*identifiers)))):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User already exists"
@@ -165,18 +183,30 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
     return Token(access_token=token, user=UserSchema.from_orm(user))
 
 
+def _user_by_email(db: Session, email: str) -> User:
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User with this email does not exist",
+        )
+    return user
+
+
+def _mark_email_verified(db: Session, user: User) -> None:
+    user.is_email_verified = True
+    user.is_verified = user.is_phone_verified or user.is_email_verified
+    db.commit()
+    invalidate_cached_user(user.id)
+
+
 @router.post("/email/send", response_model=dict)
 async def send_email_verification(
     request: EmailVerificationRequest,
     db: Session = Depends(get_db),
 ):
     """Send an email verification token to the user's email."""
-    user = db.query(User).filter(User.email == request.email).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User with this email does not exist",
-        )
+    await run_in_threadpool(_user_by_email, db, request.email)
 
     token = await email_verification_service.send_token(request.email)
 
@@ -193,12 +223,7 @@ async def verify_email_token(
     db: Session = Depends(get_db),
 ):
     """Verify an email using the token issued via /email/send."""
-    user = db.query(User).filter(User.email == request.email).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User with this email does not exist",
-        )
+    user = await run_in_threadpool(_user_by_email, db, request.email)
 
     is_valid = await email_verification_service.verify_token(request.email, request.token)
     if not is_valid:
@@ -207,15 +232,13 @@ async def verify_email_token(
             detail="Invalid or expired token",
         )
 
-    user.is_email_verified = True
-    user.is_verified = user.is_phone_verified or user.is_email_verified
-    db.commit()
+    await run_in_threadpool(_mark_email_verified, db, user)
 
     return {"message": "Email verified successfully"}
 
 
 @router.post("/login", response_model=Token)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+def login(request: LoginRequest, db: Session = Depends(get_db)):
     """Login using phone/email and password."""
     if not request.phone and not request.email:
         raise HTTPException(
@@ -223,7 +246,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
             detail="Phone or email is required"
         )
 
-    query = db.query(User)
+    query = db.query(User).options(undefer(User.hashed_password))
     if request.phone:
         query = query.filter(User.phone == request.phone)
     else:
@@ -248,7 +271,12 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
             detail="Inactive user"
         )
 
-    token = create_access_token({"sub": user.phone})
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = get_password_hash(request.password)
+        db.commit()
+        invalidate_cached_user(user.id)
+
+    token = create_access_token({"sub": str(user.id)})
     return Token(access_token=token, user=UserSchema.from_orm(user))
 
 
@@ -273,6 +301,34 @@ async def google_login():
     return RedirectResponse(url=google_auth_url)
 
 
+def _google_user(db: Session, email: str, name: str) -> User:
+    """Load or create the user for a Google account and mark the email verified."""
+    # Check if user exists
+    user = db.query(User).filter(User.email == email).first()
+    
+    if not user:
+        # Create new user
+        user = User(
+            email=email,
+            name=name,
+            is_verified=True,
+            is_email_verified=True,
+            is_phone_verified=False, # Phone not verified via Google
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    else:
+        # Update existing user if needed
+        if not user.is_email_verified:
+            user.is_email_verified = True
+            user.is_verified = True
+            db.commit()
+            invalidate_cached_user(user.id)
+            db.refresh(user)
+    return user
+
+
 @router.get("/google/callback")
 async def google_callback(code: str, db: Session = Depends(get_db)):
     """Handle Google OAuth callback."""
@@ -323,27 +379,7 @@ async def google_callback(code: str, db: Session = Depends(get_db)):
                 detail="Email not found in Google account"
             )
             
-        # Check if user exists
-        user = db.query(User).filter(User.email == email).first()
-        
-        if not user:
-            # Create new user
-            user = User(
-                email=email,
-                name=name,
-                is_verified=True,
-                is_email_verified=True,
-                is_phone_verified=False, # Phone not verified via Google
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-        else:
-            # Update existing user if needed
-            if not user.is_email_verified:
-                user.is_email_verified = True
-                user.is_verified = True
-                db.commit()
+        user = await run_in_threadpool(_google_user, db, email, name)
                 
         # Create access token
         # Use email as sub if phone is not available, or handle in create_access_token
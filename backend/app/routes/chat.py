@@ -1,13 +1,21 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import List, Dict, Optional
+from sqlalchemy import bindparam, exists, insert, select
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Dict, Optional, Set, Tuple
 from uuid import UUID
-import json
-from datetime import datetime
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
-from ..core.database import get_db
+import orjson
+
+from ..core.database import SessionLocal, get_db
+from ..core.redis import get_redis, get_redis_binary
 from ..core.auth import verify_token, get_current_user, verify_admin_token, security
+from ..models.base import uuid7
 from ..models.chat import ChatMessage
 from ..models.grouped_ride import GroupedRide
 from ..models.ride_request import RideRequest
@@ -17,33 +25,310 @@ from ..schemas.chat import ChatMessageCreate, ChatMessage as ChatMessageSchema
 
 router = APIRouter(prefix="/api/chat", tags=["Chat"])
 
+# Clients that offer this subprotocol exchange JSON in binary frames
+BINARY_SUBPROTOCOL = "gotogether.json.bin"
+
+
 class ConnectionManager:
+    # Frames buffered per client before it is treated as too slow and dropped
+    CLIENT_QUEUE_SIZE = 256
+    # Backoff between attempts to subscribe to a ride's channel, in seconds
+    SUBSCRIBE_RETRY_MIN_DELAY = 0.5
+    SUBSCRIBE_RETRY_MAX_DELAY = 30.0
+    # Queued after a ride's last event: the writer flushes what is ahead of
+    # it, then exits
+    _STOP = object()
+
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-
-    async def connect(self, websocket: WebSocket, grouped_ride_id: str):
-        await websocket.accept()
-        if grouped_ride_id not in self.active_connections:
-            self.active_connections[grouped_ride_id] = []
-        self.active_connections[grouped_ride_id].append(websocket)
-
-    def disconnect(self, websocket: WebSocket, grouped_ride_id: str):
-        if grouped_ride_id in self.active_connections:
-            if websocket in self.active_connections[grouped_ride_id]:
-                self.active_connections[grouped_ride_id].remove(websocket)
-            if not self.active_connections[grouped_ride_id]:
+        self.active_connections: Dict[UUID, Set[WebSocket]] = {}
+        # Which ride each socket belongs to, so disconnect needs no search
+        self.rides: Dict[WebSocket, UUID] = {}
+        # Outbound events per ride, drained by one writer task per ride
+        self.pending: Dict[UUID, asyncio.Queue] = {}
+        self.writers: Dict[UUID, asyncio.Task] = {}
+        # Per client: (queue of serialized frames, the task sending them, whether
+        # the client negotiated binary frames). Each client has its own sender
+        # so one slow socket never holds up the rest of the ride.
+        self.outboxes: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task, bool]] = {}
+        # Frames are published to a Redis channel per ride so sockets held by
+        # other workers get them too. This worker only subscribes to rides it
+        # has local sockets for, and one listener task routes what arrives.
+        self.pubsub = None
+        self.listener: Optional[asyncio.Task] = None
+        # Rides whose subscription failed: their frames are delivered to the
+        # local sockets directly until a background retry succeeds
+        self.local_only: Set[UUID] = set()
+        # The event loop only keeps weak references to tasks, so fire-and-forget
+        # ones are held here until they finish
+        self.tasks: Set[asyncio.Task] = set()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    @staticmethod
+    def _channel(grouped_ride_id: UUID) -> str:
+        return f"chat:{grouped_ride_id}"
+
+    async def connect(self, websocket: WebSocket, grouped_ride_id: UUID):
+        binary = BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+        await websocket.accept(subprotocol=BINARY_SUBPROTOCOL if binary else None)
+        first_local = grouped_ride_id not in self.active_connections
+        self.active_connections.setdefault(grouped_ride_id, set()).add(websocket)
+        self.rides[websocket] = grouped_ride_id
+
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE_SIZE)
+        sender = asyncio.create_task(self._send(websocket, outbox, binary))
+        self.outboxes[websocket] = (outbox, sender, binary)
+
+        if grouped_ride_id not in self.writers:
+            self.pending[grouped_ride_id] = asyncio.Queue()
+            self.writers[grouped_ride_id] = asyncio.create_task(
+                self._drain(grouped_ride_id, self.pending[grouped_ride_id])
+            )
+
+        if first_local:
+            await self._subscribe(grouped_ride_id)
+
+    def disconnect(self, websocket: WebSocket):
+        outbox = self.outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox[1].cancel()
+
+        grouped_ride_id = self.rides.pop(websocket, None)
+        if grouped_ride_id is None:
+            return
+        connections = self.active_connections.get(grouped_ride_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del self.active_connections[grouped_ride_id]
+                # Events already queued (e.g. a message sent just before the
+                # sender's tab closed) must still reach other workers, so the
+                # writer flushes its queue and exits rather than being cancelled
+                queue = self.pending.pop(grouped_ride_id, None)
+                writer = self.writers.pop(grouped_ride_id, None)
+                if writer is not None:
+                    queue.put_nowait(self._STOP)
+                    self.tasks.add(writer)
+                    writer.add_done_callback(self.tasks.discard)
+                self._spawn(self._unsubscribe(grouped_ride_id))
+
+    def publish(self, message: dict, grouped_ride_id: UUID):
+        """Queue an event for everyone connected to the ride."""
+        queue = self.pending.get(grouped_ride_id)
+        if queue is not None:
+            queue.put_nowait(message)
 
-    async def broadcast(self, message: dict, grouped_ride_id: str):
-        if grouped_ride_id in self.active_connections:
-            for connection in self.active_connections[grouped_ride_id]:
+    async def _drain(self, grouped_ride_id: UUID, queue: asyncio.Queue):
+        # Wait for one event, then take whatever else piled up meanwhile and
+        # send it as a single frame, so bursts don't cost a frame per event.
+        # A lone event is sent as-is.
+        while True:
+            batch = [await queue.get()]
+            while True:
                 try:
-                    await connection.send_json(message)
-                except Exception:
-                    pass
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Nothing is queued after _STOP: publish() no longer finds the queue
+            stopping = batch[-1] is self._STOP
+            if stopping:
+                batch.pop()
+
+            if len(batch) == 1:
+                await self.broadcast(batch[0], grouped_ride_id)
+            elif batch:
+                await self.broadcast({"type": "batch", "events": batch}, grouped_ride_id)
+
+            if stopping:
+                return
+
+    async def _send(self, websocket: WebSocket, outbox: asyncio.Queue, binary: bool):
+        # Binary clients' outboxes hold the published bytes unchanged; text
+        # clients' hold the str decoded once per frame in _deliver
+        try:
+            while True:
+                frame = await outbox.get()
+                if binary:
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
+
+    async def _try_subscribe(self, grouped_ride_id: UUID) -> bool:
+        try:
+            if self.pubsub is None:
+                self.pubsub = (await get_redis_binary()).pubsub(ignore_subscribe_messages=True)
+            await self.pubsub.subscribe(self._channel(grouped_ride_id))
+            if self.listener is None or self.listener.done():
+                self.listener = asyncio.create_task(self._listen())
+        except Exception as e:
+            print(f"Error subscribing to chat channel: {e}")
+            return False
+        return True
+
+    async def _subscribe(self, grouped_ride_id: UUID):
+        if await self._try_subscribe(grouped_ride_id):
+            self.local_only.discard(grouped_ride_id)
+            return
+        # Without the subscription the ride's published frames never come
+        # back to this worker; deliver locally and keep retrying
+        if grouped_ride_id not in self.local_only:
+            self.local_only.add(grouped_ride_id)
+            self._spawn(self._retry_subscribe(grouped_ride_id))
+
+    async def _retry_subscribe(self, grouped_ride_id: UUID):
+        delay = self.SUBSCRIBE_RETRY_MIN_DELAY
+        try:
+            while grouped_ride_id in self.local_only and grouped_ride_id in self.active_connections:
+                await asyncio.sleep(delay)
+                if grouped_ride_id not in self.active_connections:
+                    break
+                if await self._try_subscribe(grouped_ride_id):
+                    break
+                delay = min(delay * 2, self.SUBSCRIBE_RETRY_MAX_DELAY)
+        finally:
+            self.local_only.discard(grouped_ride_id)
+
+    async def _unsubscribe(self, grouped_ride_id: UUID):
+        # A socket for the ride may have reconnected in the meantime
+        if self.pubsub is None or grouped_ride_id in self.active_connections:
+            return
+        try:
+            await self.pubsub.unsubscribe(self._channel(grouped_ride_id))
+        except Exception as e:
+            print(f"Error unsubscribing from chat channel: {e}")
+
+    async def _listen(self):
+        while True:
+            try:
+                if not self.pubsub.subscribed:
+                    await asyncio.sleep(1.0)
+                    continue
+                message = await self.pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error reading chat channel: {e}")
+                await asyncio.sleep(1.0)
+                continue
+
+            if message is None or message["type"] != "message":
+                continue
+            try:
+                grouped_ride_id = UUID(message["channel"].decode().split(":", 1)[1])
+            except (IndexError, ValueError):
+                continue
+            self._deliver(message["data"], grouped_ride_id)
+
+    async def close(self):
+        for task in list(self.tasks):
+            task.cancel()
+        if self.listener is not None:
+            self.listener.cancel()
+            self.listener = None
+        if self.pubsub is not None:
+            await self.pubsub.aclose()
+            self.pubsub = None
+
+    async def broadcast(self, message: dict, grouped_ride_id: UUID):
+        # Serialize once and publish; every worker with sockets on this ride
+        # (including this one) delivers it through its subscription
+        payload = orjson.dumps(message)
+        local = grouped_ride_id in self.local_only
+        try:
+            redis_client = await get_redis_binary()
+            await redis_client.publish(self._channel(grouped_ride_id), payload)
+        except Exception as e:
+            # Redis is unavailable; at least reach the sockets held here
+            print(f"Error publishing chat message: {e}")
+            local = True
+        if local:
+            self._deliver(payload, grouped_ride_id)
+
+    def _deliver(self, payload: bytes, grouped_ride_id: UUID):
+        # Hand the frame to every local client's sender. Binary clients get
+        # the bytes as published; the text form is decoded at most once, and
+        # only if a text client is present. Slow clients are collected and
+        # dropped after the loop, not mid-iteration.
+        text = None
+        stalled = []
+        for connection in self.active_connections.get(grouped_ride_id, ()):
+            outbox, _sender, binary = self.outboxes[connection]
+            if binary:
+                frame = payload
+            else:
+                if text is None:
+                    text = payload.decode()
+                frame = text
+            try:
+                outbox.put_nowait(frame)
+            except asyncio.QueueFull:
+                stalled.append(connection)
+
+        for connection in stalled:
+            # The client has stopped reading; drop it rather than buffer forever
+            self.disconnect(connection)
+            self._spawn(connection.close(code=status.WS_1008_POLICY_VIOLATION))
 
 manager = ConnectionManager()
 
+# Serialized history per ride, keyed by a per-ride version that chat_writer
+# bumps after every insert. A reader that raced a write can only store its
+# snapshot under the old version, which no later request looks up. The TTL
+# only bounds staleness of sender names.
+CHAT_HISTORY_TTL_SECONDS = 5 * 60
+# Refreshed on every bump; must outlive any history entry so a version that
+# expires and restarts from 0 cannot meet an old snapshot
+CHAT_HISTORY_VERSION_TTL_SECONDS = 24 * 60 * 60
+
+
+def _chat_history_version_key(grouped_ride_id) -> str:
+    return f"chat:history:version:{grouped_ride_id}"
+
+
+def _chat_history_key(grouped_ride_id, version) -> str:
+    return f"chat:history:{grouped_ride_id}:{version}"
+
+
+def _is_participant(db: Session, user_id, grouped_ride_id: UUID) -> bool:
+    return db.scalar(select(exists().where(
+        RideRequest.user_id == user_id,
+        RideRequest.grouped_ride_id == grouped_ride_id,
+        RideRequest.status.in_(["grouped", "accepted", "assigned", "completed"])
+    )))
+
+
+def _serialize_chat_history(db: Session, grouped_ride_id: UUID) -> bytes:
+    # Senders are loaded in one extra query instead of one per message;
+    # (grouped_ride_id, created_at) is indexed for the ordered scan
+    messages = db.query(ChatMessage).options(
+        selectinload(ChatMessage.user)
+    ).filter(
+        ChatMessage.grouped_ride_id == grouped_ride_id
+    ).order_by(ChatMessage.created_at).all()
+    
+    result = []
+    for msg in messages:
+        msg_dict = ChatMessageSchema.from_orm(msg)
+        if msg.sender_type == "admin":
+            msg_dict.user_name = "Support"
+        elif msg.user_id:
+            msg_dict.user_name = msg.user.name if msg.user else "Unknown"
+        else:
+            msg_dict.user_name = "System"
+        result.append(msg_dict)
+        
+    return orjson.dumps([item.model_dump() for item in result])
+
+
 @router.get("/{grouped_ride_id}/history", response_model=List[ChatMessageSchema])
 async def get_chat_history(
     grouped_ride_id: UUID,
@@ -70,127 +355,272 @@ async def get_chat_history(
             
         if actor["type"] == "user":
             # Verify participation
-            is_participant = db.query(RideRequest).filter(
-                RideRequest.user_id == actor["id"],
-                RideRequest.grouped_ride_id == grouped_ride_id,
-                RideRequest.status.in_(["grouped", "accepted", "assigned", "completed"])
-            ).first()
+            is_participant = await run_in_threadpool(_is_participant, db, actor["id"], grouped_ride_id)
             if not is_participant:
                 raise HTTPException(status_code=403, detail="Not a participant")
                 
-        messages = db.query(ChatMessage).filter(
-            ChatMessage.grouped_ride_id == grouped_ride_id
-        ).order_by(ChatMessage.created_at).all()
-        
-        result = []
-        for msg in messages:
-            msg_dict = ChatMessageSchema.from_orm(msg)
-            if msg.sender_type == "admin":
-                msg_dict.user_name = "Support"
-            elif msg.user_id:
-                sender = db.query(User).filter(User.id == msg.user_id).first()
-                msg_dict.user_name = sender.name if sender else "Unknown"
-            else:
-                msg_dict.user_name = "System"
-            result.append(msg_dict)
-            
-        return result
+        # Serve the previously serialized history if no message has been
+        # saved for this ride since (chat_writer bumps the version on insert)
+        redis_client = await get_redis()
+        version = await redis_client.get(_chat_history_version_key(grouped_ride_id)) or 0
+        history_key = _chat_history_key(grouped_ride_id, version)
+        cached = await redis_client.get(history_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+        payload = await run_in_threadpool(_serialize_chat_history, db, grouped_ride_id)
+        await redis_client.set(history_key, payload, ex=CHAT_HISTORY_TTL_SECONDS)
+        return Response(content=payload, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
         print(f"Error fetching chat history: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Chat messages waiting to be persisted. The websocket handler broadcasts a
+# message as soon as it is queued here; chat_writer() inserts them in batches.
+CHAT_WRITE_BATCH_SIZE = 100
+CHAT_WRITE_MAX_DELAY = 0.05  # seconds
+chat_write_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+_chat_writer_task: Optional[asyncio.Task] = None
+
+
+# Inserts run on one dedicated thread: a single writer per worker keeps one
+# pooled connection busy at most and never competes with the default executor
+_chat_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-writer")
+
+
+def _persist_chat_messages(rows: List[dict]) -> None:
+    with SessionLocal() as db:
+        try:
+            db.execute(insert(ChatMessage), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # One bad row (e.g. a deleted ride) shouldn't lose the whole batch
+            for row in rows:
+                try:
+                    db.execute(insert(ChatMessage), [row])
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    print(f"Error saving chat message {row['id']}: {e}")
+
+
+async def _save_chat_batch(rows: List[dict]) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_chat_write_executor, _persist_chat_messages, rows)
+    # Cached history for these rides is now out of date
+    keys = {_chat_history_version_key(row["grouped_ride_id"]) for row in rows}
+    try:
+        redis_client = await get_redis()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                pipe.expire(key, CHAT_HISTORY_VERSION_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        print(f"Error invalidating chat history cache: {e}")
+
+
+async def chat_writer():
+    """Persist queued chat messages in batches of up to 100 or every 50ms."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await chat_write_queue.get()]
+        deadline = loop.time() + CHAT_WRITE_MAX_DELAY
+        try:
+            while len(batch) < CHAT_WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(chat_write_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Shutting down mid-batch; save what was already taken off the queue
+            await _save_chat_batch(batch)
+            raise
+        await _save_chat_batch(batch)
+
+
+def start_chat_writer():
+    global _chat_writer_task
+    if _chat_writer_task is None:
+        _chat_writer_task = asyncio.create_task(chat_writer())
+
+
+async def stop_chat_writer():
+    """Stop the writer and flush anything still queued."""
+    global _chat_writer_task
+    if _chat_writer_task is not None:
+        _chat_writer_task.cancel()
+        try:
+            await _chat_writer_task
+        except asyncio.CancelledError:
+            pass
+        _chat_writer_task = None
+
+    remaining = []
+    while not chat_write_queue.empty():
+        remaining.append(chat_write_queue.get_nowait())
+    if remaining:
+        await _save_chat_batch(remaining)
+
+
+# Reconnecting clients would otherwise repeat the participation check on every
+# open. Confirmed participants are cached in Redis (value: display name) for a
+# minute; routes that take a user out of a ride drop the key.
+CHAT_MEMBER_TTL_SECONDS = 60
+
+
+def _chat_member_key(grouped_ride_id, user_id) -> str:
+    return f"chat:member:{grouped_ride_id}:{user_id}"
+
+
+# Participation check and sender name in one round trip: returns the user's
+# row only if they have an active request in the ride
+_PARTICIPANT_NAME_QUERY = select(User.name).where(
+    User.id == bindparam("user_id"),
+    exists().where(
+        RideRequest.user_id == bindparam("user_id"),
+        RideRequest.grouped_ride_id == bindparam("grouped_ride_id"),
+        RideRequest.status.in_(["grouped", "accepted", "assigned", "completed"]),
+    ),
+)
+
+
+def _load_participant_name(grouped_ride_id: UUID, user_id: UUID) -> Optional[str]:
+    # The session is closed before the socket is accepted, so an open chat
+    # never holds a pooled DB connection while idle
+    with SessionLocal() as db:
+        participant = db.execute(
+            _PARTICIPANT_NAME_QUERY, {"user_id": user_id, "grouped_ride_id": grouped_ride_id}
+        ).first()
+    if participant is None:
+        return None
+    return participant.name or "Unknown"
+
+
+async def _participant_name(grouped_ride_id: UUID, user_id: UUID) -> Optional[str]:
+    """Return the user's display name if they belong to the ride, else None."""
+    redis_client = await get_redis()
+    key = _chat_member_key(grouped_ride_id, user_id)
+    cached = await redis_client.get(key)
+    if cached is not None:
+        return cached
+
+    sender_name = await run_in_threadpool(_load_participant_name, grouped_ride_id, user_id)
+    if sender_name is None:
+        return None
+
+    await redis_client.set(key, sender_name, ex=CHAT_MEMBER_TTL_SECONDS)
+    return sender_name
+
+
+async def invalidate_chat_members(grouped_ride_id, user_ids) -> None:
+    """Forget cached chat membership after users leave a ride."""
+    keys = [_chat_member_key(grouped_ride_id, user_id) for user_id in user_ids]
+    if keys:
+        redis_client = await get_redis()
+        await redis_client.delete(*keys)
+
+
 @router.websocket("/{grouped_ride_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
     grouped_ride_id: str,
     token: str = Query(...)
 ):
-    from ..core.database import SessionLocal
-    
     # Authenticate
     actor = None
     admin_id = verify_admin_token(token)
     if admin_id:
-        actor = {"type": "admin", "id": admin_id}
+        actor = {"type": "admin", "id": UUID(admin_id), "name": "Support"}
     else:
         verified = verify_token(token)
         if verified:
             user_id_str, _ = verified
             actor = {"type": "user", "id": UUID(user_id_str)}
             
+    try:
+        ride_uuid = UUID(grouped_ride_id)
+    except ValueError:
+        actor = None
+
     if not actor:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return
         
     if actor["type"] == "user":
-        # Verify participation - create session for this check
-        db = SessionLocal()
-        try:
-            is_participant = db.query(RideRequest).filter(
-                RideRequest.user_id == actor["id"],
-                RideRequest.grouped_ride_id == UUID(grouped_ride_id),
-                RideRequest.status.in_(["grouped", "accepted", "assigned", "completed"])
-            ).first()
-            if not is_participant:
-                await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
-                return
-        finally:
-            db.close()
+        # Verify participation and look up the sender name once per connection
+        sender_name = await _participant_name(ride_uuid, actor["id"])
+        if sender_name is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+        actor["name"] = sender_name
             
-    await manager.connect(websocket, grouped_ride_id)
+    await manager.connect(websocket, ride_uuid)
+
+    # Fields that stay the same for every message on this socket
+    sender_name = actor["name"]
+    row_header = {
+        "grouped_ride_id": ride_uuid,
+        "user_id": actor["id"] if actor["type"] == "user" else None,
+        "admin_id": actor["id"] if actor["type"] == "admin" else None,
+        "message_type": "text",
+        "sender_type": actor["type"],
+    }
+    notification_header = {
+        "title": "New message in group",
+        "sender_id": actor["id"],
+        "sender_type": actor["type"],
+    }
     
     try:
         while True:
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            # Accept both binary and text frames; orjson parses either
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("bytes") or frame.get("text")
+            if not data:
+                continue
+            try:
+                message_data = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Drop the malformed frame but keep the socket open
+                continue
+            if not isinstance(message_data, dict):
+                continue
             content = message_data.get("content")
             
-            if content:
-                # Create a new session for each message
-                db = SessionLocal()
-                try:
-                    new_message = ChatMessage(
-                        grouped_ride_id=UUID(grouped_ride_id),
-                        content=content,
-                        message_type="text",
-                        sender_type=actor["type"]
-                    )
-                    
-                    if actor["type"] == "user":
-                        new_message.user_id = actor["id"]
-                        sender = db.query(User).filter(User.id == actor["id"]).first()
-                        sender_name = sender.name if sender else "Unknown"
-                    else:
-                        new_message.admin_id = UUID(actor["id"]) if isinstance(actor["id"], str) else actor["id"]
-                        sender_name = "Support"
-                    
-                    db.add(new_message)
-                    db.commit()
-                    db.refresh(new_message)
-                    
-                    response = {
-                        "id": str(new_message.id),
-                        "grouped_ride_id": str(new_message.grouped_ride_id),
-                        "user_id": str(new_message.user_id) if new_message.user_id else None,
-                        "admin_id": str(new_message.admin_id) if new_message.admin_id else None,
-                        "content": new_message.content,
-                        "message_type": new_message.message_type,
-                        "sender_type": new_message.sender_type,
-                        "created_at": new_message.created_at.isoformat(),
-                        "user_name": sender_name,
-                        "notification": {
-                            "title": f"New message in group",
-                            "body": f"{sender_name}: {content[:50]}{'...' if len(content) > 50 else ''}",
-                            "sender_id": str(actor["id"]),
-                            "sender_type": actor["type"]
-                        }
+            if isinstance(content, str) and content:
+                # The id and timestamp are assigned here so the message can be
+                # broadcast before chat_writer() has saved it
+                row = {
+                    **row_header,
+                    "id": uuid7(),
+                    "content": content,
+                    "created_at": datetime.now(timezone.utc),
+                }
+                await chat_write_queue.put(row)
+
+                # orjson serializes the UUID and datetime fields natively
+                response = {
+                    **row,
+                    "user_name": sender_name,
+                    "notification": {
+                        **notification_header,
+                        "body": f"{sender_name}: {content[:50]}{'...' if len(content) > 50 else ''}",
                     }
-                    
-                    await manager.broadcast(response, grouped_ride_id)
-                finally:
-                    db.close()
+                }
+
+                manager.publish(response, ride_uuid)
             
     except WebSocketDisconnect:
-        manager.disconnect(websocket, grouped_ride_id)
+        pass
+    finally:
+        # Any exit, including an unexpected error, must release the slot
+        manager.disconnect(websocket)
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 from datetime import datetime
@@ -13,39 +15,45 @@ from ..models.driver import Driver
 from ..schemas.notification import (
     Notification,
     NotificationResponse,
-    NotificationWithDetails,
     NotificationsList,
     SystemNotification as SystemNotificationSchema
 )
 from ..models.system_notification import SystemNotification
+from .chat import invalidate_chat_members
 
 router = APIRouter(prefix="/api/notifications", tags=["Notifications"])
 
+# Built once at import: every notifications poll reuses the same statement
+# objects (and their cached compiled SQL) with only user_id rebound.
+_RIDE_NOTIFICATIONS_QUERY = select(RideNotification).options(
+    joinedload(RideNotification.grouped_ride).joinedload(GroupedRide.driver)
+).where(
+    RideNotification.user_id == bindparam("user_id")
+).order_by(RideNotification.sent_at.desc())
+
+_SYSTEM_NOTIFICATIONS_QUERY = select(SystemNotification).where(
+    SystemNotification.user_id == bindparam("user_id")
+).order_by(SystemNotification.created_at.desc())
+
 
 @router.get("", response_model=NotificationsList)
-async def get_notifications(
+def get_notifications(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's notifications"""
-    ride_notifications = db.query(RideNotification).options(
-        joinedload(RideNotification.grouped_ride).joinedload(GroupedRide.driver)
-    ).filter(
-        RideNotification.user_id == current_user.id
-    ).order_by(RideNotification.sent_at.desc()).all()
-    
-    system_notifications = db.query(SystemNotification).filter(
-        SystemNotification.user_id == current_user.id
-    ).order_by(SystemNotification.created_at.desc()).all()
+    params = {"user_id": current_user.id}
+    ride_notifications = db.scalars(_RIDE_NOTIFICATIONS_QUERY, params).all()
+    system_notifications = db.scalars(_SYSTEM_NOTIFICATIONS_QUERY, params).all()
     
     return {
-        "ride_notifications": [NotificationWithDetails.from_orm(notif) for notif in ride_notifications],
-        "system_notifications": [SystemNotificationSchema.from_orm(notif) for notif in system_notifications]
+        "ride_notifications": ride_notifications,
+        "system_notifications": system_notifications,
     }
 
 
 @router.post("/system/{notification_id}/read", response_model=SystemNotificationSchema)
-async def mark_system_notification_read(
+def mark_system_notification_read(
     notification_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -70,7 +78,7 @@ async def mark_system_notification_read(
 
 
 @router.put("/{notification_id}/accept", response_model=Notification)
-async def accept_ride(
+def accept_ride(
     notification_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -122,13 +130,7 @@ async def accept_ride(
     return Notification.from_orm(notification)
 
 
-@router.put("/{notification_id}/reject", response_model=Notification)
-async def reject_ride(
-    notification_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """User rejects ride assignment"""
+def _reject_notification(db: Session, notification_id: str, current_user: User) -> RideNotification:
     notification = db.query(RideNotification).filter(
         RideNotification.id == notification_id,
         RideNotification.user_id == current_user.id
@@ -162,12 +164,25 @@ async def reject_ride(
     
     db.commit()
     db.refresh(notification)
+    return notification
+
+
+@router.put("/{notification_id}/reject", response_model=Notification)
+async def reject_ride(
+    notification_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """User rejects ride assignment"""
+    # The Session is synchronous; keep its queries off the event loop
+    notification = await run_in_threadpool(_reject_notification, db, notification_id, current_user)
+    await invalidate_chat_members(notification.grouped_ride_id, [current_user.id])
     
     return Notification.from_orm(notification)
 
 
 @router.post("/{notification_id}/mark-read", response_model=Notification)
-async def mark_notification_read(
+def mark_notification_read(
     notification_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
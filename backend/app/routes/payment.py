@@ -14,7 +14,7 @@ router = APIRouter(prefix="/api/payment", tags=["Payment"])
 
 
 @router.post("/split", response_model=PaymentSplitSchema, status_code=status.HTTP_201_CREATED)
-async def create_payment_split(
+def create_payment_split(
     payment_data: PaymentCreate,
     current_driver: User = Depends(require_driver_user),
     db: Session = Depends(get_db)
@@ -112,7 +112,7 @@ async def create_payment_split(
 
 
 @router.post("/{payment_id}/webhook")
-async def payment_webhook(
+def payment_webhook(
     payment_id: str,
     webhook_data: dict,
     db: Session = Depends(get_db)
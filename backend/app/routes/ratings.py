@@ -14,7 +14,7 @@ router = APIRouter(prefix="/api/trips", tags=["Ratings"])
 
 
 @router.post("/{trip_id}/rate", status_code=status.HTTP_201_CREATED)
-async def rate_trip_participants(
+def rate_trip_participants(
     trip_id: str,
     rating_data: RatingCreate,
     current_identity: Tuple[User, str] = Depends(get_current_user_with_role),
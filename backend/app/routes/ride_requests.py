@@ -5,20 +5,23 @@ from datetime import datetime
 
 from ..core.database import get_db
 from ..core.auth import get_current_user
+from ..models.admin import Admin
 from ..models.user import User
 from ..models.ride_request import RideRequest
 from ..models.grouped_ride import GroupedRide
+from ..models.system_notification import SystemNotification
 from ..schemas.ride_request import (
     RideRequestCreate,
     RideRequest as RideRequestSchema,
     RideRequestWithUser
 )
+from ..utils.auto_grouping import auto_group_railway_station_request
 
 router = APIRouter(prefix="/api/ride-requests", tags=["Ride Requests"])
 
 
 @router.post("", response_model=RideRequestSchema, status_code=status.HTTP_201_CREATED)
-async def create_ride_request(
+def create_ride_request(
     request_data: RideRequestCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -46,9 +49,6 @@ async def create_ride_request(
     
     # Auto-grouping for railway station trips
     if ride_request.is_railway_station:
-        from ..utils.auto_grouping import auto_group_railway_station_request
-        from ..models.admin import Admin
-        
         # Get system admin (first admin or create one)
         system_admin = db.query(Admin).first()
         
@@ -69,7 +69,6 @@ async def create_ride_request(
                 print(f"Auto-grouping error: {str(e)}")
                 db.rollback()
                 # Create a system notification about the error for admins
-                from ..models.system_notification import SystemNotification
                 admin_notification = SystemNotification(
                     user_id=current_user.id,
                     title="Ride Request Created",
@@ -83,7 +82,7 @@ async def create_ride_request(
 
 
 @router.get("/my-requests", response_model=List[RideRequestSchema])
-async def get_my_requests(
+def get_my_requests(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -92,11 +91,11 @@ async def get_my_requests(
         RideRequest.user_id == current_user.id
     ).order_by(RideRequest.created_at.desc()).all()
     
-    return [RideRequestSchema.from_orm(req) for req in requests]
+    return requests
 
 
 @router.get("/history", response_model=List[RideRequestSchema])
-async def get_ride_history(
+def get_ride_history(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -106,14 +105,14 @@ async def get_ride_history(
         RideRequest.status.in_(["completed", "cancelled"])
     ).order_by(RideRequest.created_at.desc()).all()
     
-    return [RideRequestSchema.from_orm(req) for req in requests]
+    return requests
 
 
 
 
 
 @router.post("/{request_id}/accept", status_code=status.HTTP_200_OK)
-async def accept_ride_request(
+def accept_ride_request(
     request_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -165,7 +164,7 @@ async def accept_ride_request(
 
 
 @router.delete("/{request_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def cancel_ride_request(
+def cancel_ride_request(
     request_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
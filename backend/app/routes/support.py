@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -27,7 +27,7 @@ class SupportResponse(BaseModel):
     user_phone: Optional[str] = None
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_support_request(
+def create_support_request(
     request: SupportCreate,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -48,11 +48,14 @@ async def create_support_request(
 
 # Admin endpoints
 @router.get("/admin/requests", response_model=List[SupportResponse])
-async def list_support_requests(
+def list_support_requests(
     db: Session = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ):
-    requests = db.query(SupportRequest).join(User).order_by(SupportRequest.created_at.desc()).all()
+    # Requesters come from the join already in the query, not a lazy load per row
+    requests = db.query(SupportRequest).join(SupportRequest.user).options(
+        contains_eager(SupportRequest.user)
+    ).order_by(SupportRequest.created_at.desc()).all()
     
     result = []
     for req in requests:
@@ -69,7 +72,7 @@ async def list_support_requests(
     return result
 
 @router.patch("/admin/requests/{request_id}")
-async def update_support_status(
+def update_support_status(
     request_id: str,
     status: str,
     db: Session = Depends(get_db),
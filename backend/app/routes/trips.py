@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from uuid import UUID
 
 from ..core.database import get_db
@@ -11,13 +11,18 @@ from ..schemas.grouped_ride import GroupedRide as GroupedRideSchema
 router = APIRouter(prefix="/api/trips", tags=["Trips"])
 
 @router.get("/{trip_id}", response_model=GroupedRideSchema)
-async def get_trip_by_id(
+def get_trip_by_id(
     trip_id: UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get trip details by ID (if user is participant)"""
-    trip = db.query(GroupedRide).filter(GroupedRide.id == trip_id).first()
+    # The participation check walks every request on the trip; hydrate the
+    # collection from the same (outer) JOIN instead of a second lazy SELECT.
+    # .first() would LIMIT the joined rows and truncate the collection.
+    trip = db.query(GroupedRide).outerjoin(GroupedRide.ride_requests).options(
+        contains_eager(GroupedRide.ride_requests)
+    ).filter(GroupedRide.id == trip_id).one_or_none()
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
         
@@ -17,59 +17,42 @@ router = APIRouter(prefix="/api/my-rides", tags=["User Rides"])
 
 
 @router.get("/upcoming", response_model=List[GroupedRideSchema])
-async def get_upcoming_rides(
+def get_upcoming_rides(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's accepted upcoming rides"""
-    # Get ride requests that are accepted
-    ride_requests = db.query(RideRequest).filter(
+    # Rides the user has an accepted request on, in one joined query
+    grouped_rides = db.query(GroupedRide).join(GroupedRide.ride_requests).filter(
         and_(
             RideRequest.user_id == current_user.id,
             RideRequest.status == "accepted",
-            RideRequest.grouped_ride_id.isnot(None)
-        )
-    ).all()
-    
-    # Get unique grouped rides
-    grouped_ride_ids = list(set([req.grouped_ride_id for req in ride_requests]))
-    grouped_rides = db.query(GroupedRide).filter(
-        and_(
-            GroupedRide.id.in_(grouped_ride_ids),
             GroupedRide.status.in_(["confirmed", "in_progress"])
         )
-    ).order_by(GroupedRide.pickup_time).all()
+    ).distinct().order_by(GroupedRide.pickup_time).all()
     
-    return [GroupedRideSchema.from_orm(ride) for ride in grouped_rides]
+    return grouped_rides
 
 
 @router.get("/completed", response_model=List[GroupedRideSchema])
-async def get_completed_rides(
+def get_completed_rides(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's completed rides with savings info"""
-    ride_requests = db.query(RideRequest).filter(
+    grouped_rides = db.query(GroupedRide).join(GroupedRide.ride_requests).filter(
         and_(
             RideRequest.user_id == current_user.id,
             RideRequest.status == "completed",
-            RideRequest.grouped_ride_id.isnot(None)
-        )
-    ).all()
-    
-    grouped_ride_ids = list(set([req.grouped_ride_id for req in ride_requests]))
-    grouped_rides = db.query(GroupedRide).filter(
-        and_(
-            GroupedRide.id.in_(grouped_ride_ids),
             GroupedRide.status == "completed"
         )
-    ).order_by(GroupedRide.created_at.desc()).all()
+    ).distinct().order_by(GroupedRide.created_at.desc()).all()
     
-    return [GroupedRideSchema.from_orm(ride) for ride in grouped_rides]
+    return grouped_rides
 
 
 @router.get("/stats", response_model=UserStats)
-async def get_ride_stats(
+def get_ride_stats(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -82,7 +65,7 @@ async def get_ride_stats(
 
 
 @router.post("/{ride_id}/rate", status_code=status.HTTP_201_CREATED)
-async def rate_ride(
+def rate_ride(
     ride_id: str,
     rating_value: int,
     comment: str = None,
@@ -150,8 +133,7 @@ Highly recommend GoTogether for affordable and reliable shared rides!
         driver_id=grouped_ride.driver_id,
         grouped_ride_id=ride_id,
         rating=rating_value,
-        comment=comment,
-        testimonial_text=testimonial
+        comment=comment
     )
     
     db.add(rating)
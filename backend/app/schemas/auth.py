@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional
 from .user import User
+from ..models.admin import AdminRole
 
 
 class OTPRequest(BaseModel):
@@ -50,6 +51,19 @@ class AdminLogin(BaseModel):
     password: str = Field(..., min_length=8, max_length=128)
 
 
+class AdminCreate(BaseModel):
+    email: EmailStr
+    password: str = Field(..., min_length=8, max_length=128)
+    name: str = Field(..., max_length=100)
+    role: AdminRole = AdminRole.ADMIN
+
+    @field_validator('role', mode='before')
+    @classmethod
+    def normalize_role(cls, v):
+        # The admin UI sends lowercase role values ("admin", "super_admin")
+        return v.upper() if isinstance(v, str) else v
+
+
 class AdminToken(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -7,7 +7,7 @@ within a 6-hour window, manage driver queues, and handle seat availability.
 
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, func
 
 from ..models.grouped_ride import GroupedRide
@@ -46,8 +46,10 @@ def find_matching_railway_station_trip(
     time_start = requested_time - timedelta(hours=time_window_hours)
     time_end = requested_time + timedelta(hours=time_window_hours)
     
-    # Find matching trips
-    matching_trips = db.query(GroupedRide).filter(
+    # Find matching trips; their requests are only counted for the seat check
+    matching_trips = db.query(GroupedRide).options(
+        selectinload(GroupedRide.ride_requests).load_only(RideRequest.id)
+    ).filter(
         and_(
             GroupedRide.is_railway_station_trip == True,
             GroupedRide.destination_address.ilike(f"%{destination_address}%"),
@@ -0,0 +1,32 @@
+"""
+Batched writes shared by the admin routes.
+
+Models only describe tables; statements that touch many rows at once live
+here so the routes that group requests or fan out notifications share one
+implementation.
+"""
+
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from ..models.ride_request import RideRequest, RideRequestStatus
+
+
+def insert_rows(db: Session, model, rows: List[Dict[str, Any]]) -> None:
+    """Insert many rows as one batched INSERT instead of a row per round-trip."""
+    # An empty parameter list would insert a single row of defaults
+    if rows:
+        db.execute(insert(model), rows)
+
+
+def group_pending_requests(db: Session, request_ids: List[UUID], grouped_ride_id: UUID) -> int:
+    """Attach pending requests to a grouped ride in one UPDATE; returns rows changed."""
+    result = db.execute(
+        update(RideRequest)
+        .where(RideRequest.id.in_(request_ids), RideRequest.status == RideRequestStatus.PENDING)
+        .values(grouped_ride_id=grouped_ride_id, status=RideRequestStatus.GROUPED)
+    )
+    return result.rowcount
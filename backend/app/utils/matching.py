@@ -65,6 +65,9 @@ class TripMatch:
     match_score: float
 
 
+EARTH_RADIUS_KM = 6371.0
+
+
 def haversine_distance(loc1: Location, loc2: Location) -> float:
     """
     Calculate the great circle distance between two points on Earth using the Haversine formula.
@@ -83,18 +86,25 @@ def haversine_distance(loc1: Location, loc2: Location) -> float:
     For more accuracy in production, consider using Vincenty's formula or PostGIS functions.
     """
     # Convert decimal degrees to radians
-    lat1, lng1, lat2, lng2 = map(math.radians, [loc1.lat, loc1.lng, loc2.lat, loc2.lng])
+    lat1, lng1 = math.radians(loc1.lat), math.radians(loc1.lng)
+    return _haversine_from_radians(lat1, lng1, math.cos(lat1), loc2)
+
+
+def _haversine_from_radians(lat1: float, lng1: float, cos_lat1: float, loc2: Location) -> float:
+    """
+    Haversine distance from a point already converted to radians (with its
+    cosine precomputed) to ``loc2``, so a query point is converted once per
+    search rather than once per candidate.
+    """
+    lat2, lng2 = math.radians(loc2.lat), math.radians(loc2.lng)
     
     # Haversine formula
     dlat = lat2 - lat1
     dlng = lng2 - lng1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
+    a = math.sin(dlat/2)**2 + cos_lat1 * math.cos(lat2) * math.sin(dlng/2)**2
     c = 2 * math.asin(math.sqrt(a))
     
-    # Earth's radius in kilometers
-    earth_radius_km = 6371.0
-    
-    return earth_radius_km * c
+    return EARTH_RADIUS_KM * c
 
 
 def encode_geohash(location: Location, precision: int = 7) -> str:
@@ -206,8 +216,8 @@ def find_matching_trips(
         List of matching trips, sorted by match score (best first)
         
     Algorithm:
-    1. Filter candidates by distance constraints
-    2. Filter candidates by time window
+    1. Filter candidates by time window (cheap, so it runs first)
+    2. Filter candidates by distance constraints
     3. Calculate match scores
     4. Sort by score descending
     
@@ -215,20 +225,19 @@ def find_matching_trips(
     """
     matches = []
     
+    # Query-side trigonometry is the same for every candidate
+    origin_lat = math.radians(query.origin.lat)
+    origin_lng = math.radians(query.origin.lng)
+    origin_cos = math.cos(origin_lat)
+    dest_lat = math.radians(query.destination.lat)
+    dest_lng = math.radians(query.destination.lng)
+    dest_cos = math.cos(dest_lat)
+    
     for candidate in candidates:
         # Skip if no available seats
         if candidate.available_seats <= 0:
             continue
             
-        # Calculate distances
-        origin_distance = haversine_distance(query.origin, candidate.origin)
-        dest_distance = haversine_distance(query.destination, candidate.destination)
-        
-        # Filter by distance constraints
-        if (origin_distance > query.max_origin_distance or 
-            dest_distance > query.max_dest_distance):
-            continue
-            
         # Calculate time difference
         time_diff = abs((candidate.departure_time - query.departure_time).total_seconds() / 60)
         
@@ -236,6 +245,15 @@ def find_matching_trips(
         if time_diff > query.time_window_minutes:
             continue
             
+        # Filter by distance constraints, skipping the destination distance
+        # when the origin is already too far
+        origin_distance = _haversine_from_radians(origin_lat, origin_lng, origin_cos, candidate.origin)
+        if origin_distance > query.max_origin_distance:
+            continue
+        dest_distance = _haversine_from_radians(dest_lat, dest_lng, dest_cos, candidate.destination)
+        if dest_distance > query.max_dest_distance:
+            continue
+            
         # Calculate match score
         match_score = calculate_match_score(
             query, candidate, origin_distance, dest_distance, int(time_diff)
@@ -0,0 +1,82 @@
+"""
+Keyset (cursor) pagination for admin list endpoints.
+
+OFFSET pagination makes Postgres read and discard every skipped row, so deep
+pages get linearly slower. Keyset pagination instead resumes after the last
+row of the previous page using the (created_at, id) sort key, which the
+(created_at, id) indexes turn into a single index seek per page.
+
+The cursor is opaque to clients: a URL-safe base64 of "<created_at>|<id>".
+Endpoints return the cursor for the next page in the X-Next-Cursor header so
+their JSON bodies (plain lists) stay unchanged.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a row's sort key as an opaque cursor string."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor, rejecting malformed input with 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def keyset_page(
+    query: Query,
+    model,
+    cursor: Optional[str],
+    limit: int,
+    response: Response,
+    skip: int = 0,
+) -> List:
+    """
+    Fetch one page of ``query`` newest first, starting after ``cursor``.
+
+    Args:
+        query: Filtered query over ``model`` (without ORDER BY/OFFSET/LIMIT)
+        model: Mapped class with created_at and id columns
+        cursor: Cursor from a previous page's X-Next-Cursor header, or None
+        limit: Maximum rows to return
+        response: Response on which the next cursor header is set
+        skip: Deprecated OFFSET, honoured only when no cursor is given
+
+    Returns:
+        Rows of the page; X-Next-Cursor is only set when more rows follow
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if skip and not cursor:
+        query = query.offset(skip)
+
+    # One extra row tells us whether another page exists
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return rows
@@ -0,0 +1,118 @@
+"""
+Unit tests for password hashing and JWT verification.
+
+Tests cover:
+- PBKDF2-SHA512 hashing and verification
+- Legacy passlib PBKDF2-SHA256 hashes and password_needs_rehash
+- Batch JWT verification with verify_tokens_bulk
+"""
+
+from datetime import timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+from passlib.hash import pbkdf2_sha256, pbkdf2_sha512
+
+from app.core.auth import (
+    create_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+    verify_tokens_bulk,
+)
+from app.core.config import settings
+
+
+class TestPasswordHashing:
+    """Test current-scheme hashing"""
+
+    def test_hash_and_verify(self):
+        hashed = get_password_hash("correct horse")
+        assert hashed.startswith("$pbkdf2-sha512$")
+        assert verify_password("correct horse", hashed)
+        assert not verify_password("wrong horse", hashed)
+
+    def test_each_hash_gets_fresh_salt(self):
+        assert get_password_hash("same password") != get_password_hash("same password")
+
+    def test_current_hash_needs_no_rehash(self):
+        assert not password_needs_rehash(get_password_hash("correct horse"))
+
+    def test_stale_round_count_needs_rehash(self):
+        prefix, rounds, salt, checksum = get_password_hash("correct horse")[1:].split("$")
+        stale = f"${prefix}${int(rounds) - 1}${salt}${checksum}"
+        assert password_needs_rehash(stale)
+
+    @pytest.mark.parametrize("hashed", ["", "plaintext", "$pbkdf2-sha512$25000$onlysalt"])
+    def test_unsupported_hash(self, hashed):
+        assert not verify_password("anything", hashed)
+        assert password_needs_rehash(hashed)
+
+
+class TestLegacyPasslibHashes:
+    """Hashes written by passlib before the hashlib rewrite must keep working"""
+
+    @pytest.fixture
+    def legacy_hash(self):
+        return pbkdf2_sha256.using(rounds=1000).hash("old password")
+
+    def test_legacy_hash_verifies(self, legacy_hash):
+        assert legacy_hash.startswith("$pbkdf2-sha256$")
+        assert verify_password("old password", legacy_hash)
+        assert not verify_password("other password", legacy_hash)
+
+    def test_legacy_hash_needs_rehash(self, legacy_hash):
+        assert password_needs_rehash(legacy_hash)
+
+    def test_new_hash_readable_by_passlib(self):
+        # Stored format stays compatible with passlib's pbkdf2_sha512
+        assert pbkdf2_sha512.verify("correct horse", get_password_hash("correct horse"))
+
+
+class TestVerifyTokensBulk:
+    """Test batch JWT verification"""
+
+    def test_valid_tokens(self):
+        user_ids = [str(uuid4()) for _ in range(3)]
+        tokens = [create_access_token({"sub": user_id}) for user_id in user_ids]
+        assert verify_tokens_bulk(tokens) == user_ids
+
+    def test_preserves_order_and_duplicates(self):
+        first, second = str(uuid4()), str(uuid4())
+        token_a = create_access_token({"sub": first})
+        token_b = create_access_token({"sub": second})
+        assert verify_tokens_bulk([token_a, token_b, token_a]) == [first, second, first]
+
+    def test_cached_result_matches(self):
+        user_id = str(uuid4())
+        token = create_access_token({"sub": user_id})
+        assert verify_tokens_bulk([token]) == [user_id]
+        assert verify_tokens_bulk([token]) == [user_id]
+
+    def test_rejects_tampered_signature(self):
+        token = create_access_token({"sub": str(uuid4())})
+        signing_input, _, signature = token.rpartition(".")
+        tampered = f"{signing_input}.{'A' if signature[0] != 'A' else 'B'}{signature[1:]}"
+        assert verify_tokens_bulk([tampered]) == [None]
+
+    def test_rejects_expired_token(self):
+        token = create_access_token({"sub": str(uuid4())}, expires_delta=timedelta(seconds=-1))
+        assert verify_tokens_bulk([token]) == [None]
+
+    def test_rejects_garbage(self):
+        assert verify_tokens_bulk(["not.a.jwt", ""]) == [None, None]
+
+    def test_mixed_batch(self):
+        user_id = str(uuid4())
+        good = create_access_token({"sub": user_id})
+        expired = create_access_token({"sub": str(uuid4())}, expires_delta=timedelta(seconds=-1))
+        assert verify_tokens_bulk([expired, good, "garbage"]) == [None, user_id, None]
+
+    def test_rejects_foreign_key(self):
+        foreign = jwt.encode(
+            {"sub": str(uuid4()), "exp": 4102444800},
+            settings.secret_key + "-other",
+            algorithm=settings.algorithm,
+        )
+        assert verify_tokens_bulk([foreign]) == [None]
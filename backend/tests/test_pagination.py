@@ -0,0 +1,142 @@
+"""
+Unit tests for keyset (cursor) pagination.
+
+Tests cover:
+- Cursor encoding round trip and rejection of malformed cursors
+- Paging through rows that share a created_at timestamp
+- X-Next-Cursor only being set while more rows follow
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import Column, DateTime, Uuid, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, nullable=False)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def add_rows(db, timestamps):
+    rows = [Row(id=uuid.uuid4(), created_at=ts) for ts in timestamps]
+    db.add_all(rows)
+    db.commit()
+    # Newest first, ties broken by id descending
+    return sorted(rows, key=lambda row: (row.created_at, row.id), reverse=True)
+
+
+def fetch_all_pages(db, limit):
+    pages = []
+    cursor = None
+    while True:
+        response = Response()
+        page = keyset_page(db.query(Row), Row, cursor, limit, response)
+        pages.append(page)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+class TestCursor:
+    """Test cursor encoding and decoding"""
+
+    def test_round_trip(self):
+        created_at = datetime(2024, 5, 17, 9, 30, 15, 123456)
+        row_id = uuid.uuid4()
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2024, 5, 17), uuid.uuid4())
+        assert "=" not in cursor
+        assert "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize("cursor", [
+        "not a cursor",
+        "",
+        "%%%",
+        encode_cursor(datetime(2024, 5, 17), uuid.uuid4())[:-6],
+    ])
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+
+
+class TestKeysetPage:
+    """Test paging over (created_at, id)"""
+
+    def test_pages_cover_every_row_once(self, db):
+        base = datetime(2024, 1, 1)
+        expected = add_rows(db, [base + timedelta(minutes=i) for i in range(7)])
+
+        pages = fetch_all_pages(db, limit=3)
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [row.id for page in pages for row in page] == [row.id for row in expected]
+
+    def test_ties_on_created_at(self, db):
+        # Page boundaries fall inside a run of identical timestamps; the id
+        # tiebreaker must neither skip nor repeat rows
+        same = datetime(2024, 1, 1, 12, 0)
+        expected = add_rows(db, [same] * 5 + [same - timedelta(seconds=1)] * 2)
+
+        pages = fetch_all_pages(db, limit=2)
+
+        ids = [row.id for page in pages for row in page]
+        assert ids == [row.id for row in expected]
+        assert len(set(ids)) == 7
+
+    def test_no_next_cursor_on_last_page(self, db):
+        base = datetime(2024, 1, 1)
+        add_rows(db, [base + timedelta(minutes=i) for i in range(4)])
+
+        response = Response()
+        first = keyset_page(db.query(Row), Row, None, 2, response)
+        assert len(first) == 2
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        assert cursor is not None
+
+        # Exactly two rows remain: a full page, but nothing after it
+        response = Response()
+        last = keyset_page(db.query(Row), Row, cursor, 2, response)
+        assert len(last) == 2
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_empty_result(self, db):
+        response = Response()
+        assert keyset_page(db.query(Row), Row, None, 10, response) == []
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_skip_ignored_with_cursor(self, db):
+        base = datetime(2024, 1, 1)
+        expected = add_rows(db, [base + timedelta(minutes=i) for i in range(6)])
+
+        response = Response()
+        keyset_page(db.query(Row), Row, None, 2, response)
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+
+        page = keyset_page(db.query(Row), Row, cursor, 2, Response(), skip=3)
+        assert [row.id for row in page] == [row.id for row in expected[2:4]]
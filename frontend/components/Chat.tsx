@@ -80,7 +80,9 @@ export default function Chat({ groupedRideId, fullScreen = false, authToken, cur
         wsUrl = `${wsUrl}/api/chat/${groupedRideId}?token=${encodeURIComponent(token)}`;
 
         console.log('Connecting to WS:', wsUrl);
-        const ws = new WebSocket(wsUrl);
+        // JSON travels in binary frames when the server accepts this subprotocol
+        const ws = new WebSocket(wsUrl, ['gotogether.json.bin']);
+        ws.binaryType = 'arraybuffer';
 
         ws.onopen = () => {
             setIsConnected(true);
@@ -88,8 +90,16 @@ export default function Chat({ groupedRideId, fullScreen = false, authToken, cur
 
         ws.onmessage = (event) => {
             try {
-                const message = JSON.parse(event.data);
-                setMessages((prev) => [...prev, message]);
+                const raw = typeof event.data === 'string'
+                    ? event.data
+                    : new TextDecoder().decode(event.data);
+                const data = JSON.parse(raw);
+                // Bursts of messages arrive coalesced as { type: 'batch', events: [...] }
+                const incoming = data.type === 'batch' ? data.events : [data];
+                setMessages((prev) => [...prev, ...incoming]);
+
+                // Notify once per frame, for the latest message
+                const message = incoming[incoming.length - 1];
 
                 // Show notification if message is from someone else
                 if (message.notification) {
@@ -163,7 +173,7 @@ export default function Chat({ groupedRideId, fullScreen = false, authToken, cur
     const sendMessage = async (e: React.FormEvent) => {
         e.preventDefault();
         if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN && newMessage.trim()) {
-            wsRef.current.send(JSON.stringify({ content: newMessage }));
+            wsRef.current.send(new TextEncoder().encode(JSON.stringify({ content: newMessage })));
             setNewMessage('');
         }
     };
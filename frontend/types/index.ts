@@ -167,7 +167,6 @@ export interface Rating {
   grouped_ride_id: string;
   rating: number;
   comment?: string;
-  testimonial_text?: string;
   created_at: string;
   updated_at?: string;
 }